@@ -7,10 +7,15 @@ GitHub: https://github.com/MuhammadQaisarAli
 This module defines the data structures and models for GNSSSignalSim configuration.
 """
 
+import os
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union
+from functools import cached_property
+from typing import List, Dict, Any, Iterable, Optional, Union
 from enum import Enum
 
+# Marks fields that convert_field leaves out of the exported dictionary
+_SKIP = object()
+
 
 class TimeType(Enum):
     """Time system types supported by GNSSSignalSim."""
@@ -182,8 +187,13 @@ class EphemerisConfig:
     name: str = ""
     include: bool = True  # Whether to include this file in configuration output
 
+    @cached_property
+    def basename(self) -> str:
+        """File name part of name; name is not reassigned after construction."""
+        return os.path.basename(self.name)
 
-@dataclass
+
+@dataclass(slots=True)
 class SystemSelect:
     """System and signal selection."""
 
@@ -244,7 +254,7 @@ class SignalPowerConfig:
     signal_power: List[SignalPower] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AlmanacConfig:
     """Almanac configuration data."""
 
@@ -265,6 +275,21 @@ class OutputSettings:
     config: OutputConfig = field(default_factory=OutputConfig)
     system_select: List[SystemSelect] = field(default_factory=list)
 
+    @cached_property
+    def enabled_signals(self) -> List[SystemSelect]:
+        """Enabled entries of system_select; call mark_dirty() after edits."""
+        return [s for s in self.system_select if s.enable]
+
+    @cached_property
+    def enabled_constellations(self) -> List[ConstellationType]:
+        """Distinct systems of the enabled signals, in selection order."""
+        return list(dict.fromkeys(s.system for s in self.enabled_signals))
+
+    def mark_dirty(self):
+        """Drop cached signal summaries after system_select was modified."""
+        self.__dict__.pop("enabled_signals", None)
+        self.__dict__.pop("enabled_constellations", None)
+
 
 @dataclass
 class GNSSSignalSimConfig:
@@ -280,8 +305,18 @@ class GNSSSignalSimConfig:
     power: SignalPowerConfig = field(default_factory=SignalPowerConfig)
     almanac: List[AlmanacConfig] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary for JSON export."""
+    def __post_init__(self):
+        # Serialized top-level sections, reused by to_dict(changed=...)
+        self._section_cache: Dict[str, Any] = {}
+
+    def to_dict(self, changed: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Convert configuration to dictionary for JSON export.
+
+        With changed=None every section is rebuilt. Otherwise only the named
+        top-level fields (and any not yet cached) are rebuilt, and the other
+        sections are reused from the previous incremental call; the result
+        then shares those sections and must be treated as read-only.
+        """
 
         def to_camel_case(snake_str):
             components = snake_str.split("_")
@@ -292,103 +327,119 @@ class GNSSSignalSimConfig:
                 return obj.value
             return obj
 
+        def convert_field(obj, field_name):
+            value = getattr(obj, field_name)
+
+            # Special handling for SystemSelect to ensure signal field is always present
+            if obj.__class__.__name__ == "SystemSelect":
+                if field_name == "signal" and (value is None or value == ""):
+                    # Use default signal for the system if signal is missing
+                    system_value = getattr(obj, "system")
+                    if system_value == ConstellationType.GPS:
+                        value = "L1CA"
+                    elif system_value == ConstellationType.BDS:
+                        value = "B1C"
+                    elif system_value == ConstellationType.GALILEO:
+                        value = "E1"
+                    elif system_value == ConstellationType.GLONASS:
+                        value = "G1"
+                    else:
+                        value = "L1CA"  # Default fallback
+
+            # Special handling for ephemeris list to only include selected files
+            if obj.__class__.__name__ == "GNSSSignalSimConfig" and field_name == "ephemeris":
+                # Filter to only include ephemeris files marked as included
+                value = [eph for eph in value if getattr(eph, 'include', True)]
+
+            # Special handling for OutputSettings interval field
+            if obj.__class__.__name__ == "OutputSettings":
+                if field_name == "interval":
+                    # Only include interval for position and observation outputs
+                    output_type = getattr(obj, "type")
+                    if output_type not in [
+                        OutputType.POSITION,
+                        OutputType.OBSERVATION,
+                    ]:
+                        return _SKIP
+                # Skip sample_freq and center_freq for non-IFdata outputs
+                elif field_name in ["sample_freq", "center_freq"]:
+                    output_type = getattr(obj, "type")
+                    if output_type != OutputType.IF_DATA:
+                        return _SKIP
+
+            # Skip the include field for EphemerisConfig (UI-only field)
+            if obj.__class__.__name__ == "EphemerisConfig" and field_name == "include":
+                return _SKIP
+
+            # Special handling for VelocityConfig to only include relevant units and values
+            if obj.__class__.__name__ == "VelocityConfig":
+                velocity_type = getattr(obj, "type")
+                if velocity_type == VelocityType.SCU:
+                    # For SCU, only include speed, course, up, speedUnit and angleUnit
+                    if field_name in ["east", "north", "x", "y", "z", "east_unit", "north_unit", "up_unit", "x_unit", "y_unit", "z_unit"]:
+                        return _SKIP
+                elif velocity_type == VelocityType.ENU:
+                    # For ENU, only include east, north, up, eastUnit, northUnit, upUnit
+                    if field_name in ["speed", "course", "x", "y", "z", "speed_unit", "angle_unit", "x_unit", "y_unit", "z_unit"]:
+                        return _SKIP
+                elif velocity_type == VelocityType.ECEF:
+                    # For ECEF, only include x, y, z, xUnit, yUnit, zUnit
+                    if field_name in ["speed", "course", "up", "east", "north", "speed_unit", "angle_unit", "east_unit", "north_unit", "up_unit"]:
+                        return _SKIP
+
+            # Special handling for PositionConfig to only include relevant fields
+            if obj.__class__.__name__ == "PositionConfig":
+                position_type = getattr(obj, "type")
+                if position_type == PositionType.LLA:
+                    # For LLA, only include type, format, longitude, latitude, altitude
+                    if field_name in ["x", "y", "z"]:
+                        return _SKIP
+                elif position_type == PositionType.ECEF:
+                    # For ECEF, only include type, x, y, z
+                    if field_name in ["format", "longitude", "latitude", "altitude"]:
+                        return _SKIP
+
+            # Skip None values except for SystemSelect signal field
+            if value is None and not (
+                obj.__class__.__name__ == "SystemSelect"
+                and field_name == "signal"
+            ):
+                return _SKIP
+
+            if isinstance(value, list):
+                return [convert_dataclass(item) for item in value]
+            elif hasattr(value, "__dataclass_fields__"):
+                return convert_dataclass(value)
+            return convert_enum(value)
+
         def convert_dataclass(obj):
             if hasattr(obj, "__dataclass_fields__"):
                 result = {}
-                for field_name, field_def in obj.__dataclass_fields__.items():
-                    value = getattr(obj, field_name)
-
-                    # Special handling for SystemSelect to ensure signal field is always present
-                    if obj.__class__.__name__ == "SystemSelect":
-                        if field_name == "signal" and (value is None or value == ""):
-                            # Use default signal for the system if signal is missing
-                            system_value = getattr(obj, "system")
-                            if system_value == ConstellationType.GPS:
-                                value = "L1CA"
-                            elif system_value == ConstellationType.BDS:
-                                value = "B1C"
-                            elif system_value == ConstellationType.GALILEO:
-                                value = "E1"
-                            elif system_value == ConstellationType.GLONASS:
-                                value = "G1"
-                            else:
-                                value = "L1CA"  # Default fallback
-
-                    # Special handling for ephemeris list to only include selected files
-                    if obj.__class__.__name__ == "GNSSSignalSimConfig" and field_name == "ephemeris":
-                        # Filter to only include ephemeris files marked as included
-                        value = [eph for eph in value if getattr(eph, 'include', True)]
-
-                    # Special handling for OutputSettings interval field
-                    if obj.__class__.__name__ == "OutputSettings":
-                        if field_name == "interval":
-                            # Only include interval for position and observation outputs
-                            output_type = getattr(obj, "type")
-                            if output_type not in [
-                                OutputType.POSITION,
-                                OutputType.OBSERVATION,
-                            ]:
-                                continue
-                        # Skip sample_freq and center_freq for non-IFdata outputs
-                        elif field_name in ["sample_freq", "center_freq"]:
-                            output_type = getattr(obj, "type")
-                            if output_type != OutputType.IF_DATA:
-                                continue
-
-                    # Skip the include field for EphemerisConfig (UI-only field)
-                    if obj.__class__.__name__ == "EphemerisConfig" and field_name == "include":
-                        continue
-
-                    # Special handling for VelocityConfig to only include relevant units and values
-                    if obj.__class__.__name__ == "VelocityConfig":
-                        velocity_type = getattr(obj, "type")
-                        if velocity_type == VelocityType.SCU:
-                            # For SCU, only include speed, course, up, speedUnit and angleUnit
-                            if field_name in ["east", "north", "x", "y", "z", "east_unit", "north_unit", "up_unit", "x_unit", "y_unit", "z_unit"]:
-                                continue
-                        elif velocity_type == VelocityType.ENU:
-                            # For ENU, only include east, north, up, eastUnit, northUnit, upUnit
-                            if field_name in ["speed", "course", "x", "y", "z", "speed_unit", "angle_unit", "x_unit", "y_unit", "z_unit"]:
-                                continue
-                        elif velocity_type == VelocityType.ECEF:
-                            # For ECEF, only include x, y, z, xUnit, yUnit, zUnit
-                            if field_name in ["speed", "course", "up", "east", "north", "speed_unit", "angle_unit", "east_unit", "north_unit", "up_unit"]:
-                                continue
-
-                    # Special handling for PositionConfig to only include relevant fields
-                    if obj.__class__.__name__ == "PositionConfig":
-                        position_type = getattr(obj, "type")
-                        if position_type == PositionType.LLA:
-                            # For LLA, only include type, format, longitude, latitude, altitude
-                            if field_name in ["x", "y", "z"]:
-                                continue
-                        elif position_type == PositionType.ECEF:
-                            # For ECEF, only include type, x, y, z
-                            if field_name in ["format", "longitude", "latitude", "altitude"]:
-                                continue
-
-                    # Skip None values except for SystemSelect signal field
-                    if value is None and not (
-                        obj.__class__.__name__ == "SystemSelect"
-                        and field_name == "signal"
-                    ):
-                        continue
-
-                    camel_case_name = to_camel_case(field_name)
-
-                    if isinstance(value, list):
-                        result[camel_case_name] = [
-                            convert_dataclass(item) for item in value
-                        ]
-                    elif hasattr(value, "__dataclass_fields__"):
-                        result[camel_case_name] = convert_dataclass(value)
-                    else:
-                        result[camel_case_name] = convert_enum(value)
+                for field_name in obj.__dataclass_fields__:
+                    value = convert_field(obj, field_name)
+                    if value is not _SKIP:
+                        result[to_camel_case(field_name)] = value
                 return result
             else:
                 return convert_enum(obj)
 
-        return convert_dataclass(self)
+        # Full conversions never share containers with the cache, so callers
+        # may freely modify the returned dict
+        if changed is None:
+            return convert_dataclass(self)
+
+        cache = self._section_cache
+        for field_name in changed:
+            cache.pop(field_name, None)
+
+        result = {}
+        for field_name in self.__dataclass_fields__:
+            if field_name not in cache:
+                cache[field_name] = convert_field(self, field_name)
+            value = cache[field_name]
+            if value is not _SKIP:
+                result[to_camel_case(field_name)] = value
+        return result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GNSSSignalSimConfig":
@@ -152,7 +152,7 @@ class TemplateManager:
 
     def get_template_names(self) -> List[str]:
         """Get list of available template names."""
-        built_in_names = list(self.built_in_templates.keys())
+        built_in_names = self.get_built_in_template_names()
         custom_names = self.get_custom_template_names()
         return built_in_names + custom_names
 
@@ -222,6 +222,10 @@ class TemplateManager:
             error(f"Error deleting template '{name}': {e}")
             return False
 
+    def get_built_in_template_names(self) -> List[str]:
+        """Get list of built-in template names."""
+        return list(self.built_in_templates.keys())
+
     def is_built_in_template(self, name: str) -> bool:
         """Check if a template is a built-in template."""
         return name in self.built_in_templates
@@ -238,6 +242,19 @@ class TemplateManager:
             }
         return None
 
+    def get_all_template_infos(
+        self, names: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """Get template information keyed by name, for the given or all available templates."""
+        if names is None:
+            names = self.get_template_names()
+        infos = {}
+        for name in names:
+            template_info = self.get_template_info(name)
+            if template_info:
+                infos[name] = template_info
+        return infos
+
 
 # Global template manager instance
 template_manager = TemplateManager()
@@ -12,7 +12,8 @@ Based on GNSSSignalSim JSON format specification.md Section 4.
 
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from itertools import chain, islice
+from typing import Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -73,6 +74,10 @@ class RinexHeader:
     leap_seconds: int = 18
 
 
+# Read buffer for RINEX files; navigation files can be tens of MB
+_READ_BUFFER_SIZE = 1 << 20
+
+
 class RinexParseError(Exception):
     """Exception raised when RINEX parsing fails."""
     pass
@@ -105,17 +110,24 @@ class RinexParser:
         info(f"Parsing RINEX file: {os.path.basename(file_path)}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            # Parse header
-            header_end = self._parse_header(lines)
-            
-            # Parse data records
-            if self.header.file_type.startswith('N'):  # Navigation file
-                self._parse_navigation_data(lines[header_end:])
-            else:
-                debug(f"File type {self.header.file_type} not supported for ephemeris parsing")
+            # Stream the file so only the header and one record are held at a time
+            with open(file_path, 'r', encoding='utf-8', errors='ignore',
+                      buffering=_READ_BUFFER_SIZE) as f:
+                header_lines = []
+                for line in f:
+                    header_lines.append(line)
+                    if "END OF HEADER" in line:
+                        break
+
+                # Parse header
+                header_end = self._parse_header(header_lines)
+
+                # Parse data records; without an end of header marker the
+                # data starts at the first line
+                if self.header.file_type.startswith('N'):  # Navigation file
+                    self._parse_navigation_data(f if header_end else header_lines)
+                else:
+                    debug(f"File type {self.header.file_type} not supported for ephemeris parsing")
             
             # Calculate validity range
             self._calculate_validity_range()
@@ -196,31 +208,35 @@ class RinexParser:
         
         return line_idx
 
-    def _parse_navigation_data(self, data_lines: List[str]):
-        """Parse navigation data records."""
+    def _parse_navigation_data(self, data_lines: Iterable[str]):
+        """Parse navigation data records, reading one record at a time."""
+        lines = iter(data_lines)
         i = 0
-        while i < len(data_lines):
-            line = data_lines[i].strip()
-            if not line:
+        while (line := next(lines, None)) is not None:
+            if not line.strip():
                 i += 1
                 continue
             
+            # Records are typically 8 lines long
+            record_lines = [line, *islice(lines, 7)]
             try:
                 # Parse satellite identifier and time
                 if self.header.version in [RinexVersion.VERSION_2]:
-                    record = self._parse_v2_nav_record(data_lines[i:i+8])
+                    record = self._parse_v2_nav_record(record_lines)
                 else:
-                    record = self._parse_v3_nav_record(data_lines[i:i+8])
+                    record = self._parse_v3_nav_record(record_lines)
                 
                 if record:
                     self.ephemeris_records.append(record)
                     debug(f"Parsed ephemeris for {record.satellite_system.value}{record.satellite_number:02d}")
                 
-                # Move to next record (typically 8 lines per record)
-                i += 8
+                # Move to next record
+                i += len(record_lines)
                 
             except Exception as e:
                 debug(f"Error parsing navigation record at line {i}: {str(e)}")
+                # Retry from the line after the record start
+                lines = chain(record_lines[1:], lines)
                 i += 1
 
     def _parse_v2_nav_record(self, record_lines: List[str]) -> Optional[EphemerisRecord]:
@@ -390,8 +406,8 @@ class RinexParser:
             Tuple of (start_time, end_time) or None if parsing fails
         """
         try:
-            parser = RinexParser()
-            result = parser.parse_file(file_path)
+            # Reuse an earlier parse of the unchanged file instead of reading it again
+            result = parse_rinex_file_cached(file_path)
             return result.get('validity_range')
         except Exception as e:
             debug(f"Quick parse failed for {file_path}: {str(e)}")
@@ -443,6 +459,70 @@ def parse_rinex_file(file_path: str) -> Dict:
     return parser.parse_file(file_path)
 
 
+# Parse outcomes by absolute path, stored as (mtime in ns, size in bytes, outcome);
+# the outcome is the result dictionary or the RinexParseError that was raised
+_parse_cache: Dict[str, Tuple[int, int, object]] = {}
+
+
+def parse_rinex_file_cached(file_path: str) -> Dict:
+    """
+    Parse a RINEX file, reusing the previous outcome while the file is unchanged.
+    
+    The file is parsed again when its modification time or size changes.
+    The returned dictionary is shared between callers and must not be modified.
+    
+    Args:
+        file_path: Path to the RINEX file
+        
+    Returns:
+        Dictionary containing parsed information
+        
+    Raises:
+        RinexParseError: If parsing fails
+        OSError: If the file cannot be accessed
+    """
+    abs_path = os.path.abspath(file_path)
+    stat_result = os.stat(abs_path)
+    cached = _parse_cache.get(abs_path)
+    if (
+        cached is not None
+        and cached[0] == stat_result.st_mtime_ns
+        and cached[1] == stat_result.st_size
+    ):
+        outcome = cached[2]
+    else:
+        try:
+            outcome = parse_rinex_file(abs_path)
+        except RinexParseError as e:
+            outcome = e
+        _parse_cache[abs_path] = (stat_result.st_mtime_ns, stat_result.st_size, outcome)
+
+    if isinstance(outcome, RinexParseError):
+        raise RinexParseError(str(outcome))
+    return outcome
+
+
+def is_rinex_parse_cached(file_path: str) -> bool:
+    """
+    Check if parse_rinex_file_cached() can answer without reading the file.
+    
+    Args:
+        file_path: Path to the RINEX file
+        
+    Returns:
+        True if an outcome for the unchanged file is cached, False otherwise
+    """
+    abs_path = os.path.abspath(file_path)
+    cached = _parse_cache.get(abs_path)
+    if cached is None:
+        return False
+    try:
+        stat_result = os.stat(abs_path)
+    except OSError:
+        return False
+    return cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size
+
+
 def get_ephemeris_validity_range(file_path: str) -> Optional[Tuple[datetime, datetime]]:
     """
     Get the validity range from a RINEX ephemeris file.
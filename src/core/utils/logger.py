@@ -190,14 +190,27 @@ def log_validation_error(field_name, value, error_msg, tab_name=None):
     logger.log_validation_error(field_name, value, error_msg, tab_name)
 
 
-def configure_logging_from_settings(settings_manager):
-    """Configure logging based on settings manager."""
+def get_logging_fingerprint(settings_manager) -> tuple:
+    """Get the logging settings that configure_logging_from_settings applies.
+
+    Returns (enable_console, console_level, enable_file, file_level).
+    """
     logging_settings = settings_manager.get_section("logging")
-    
-    enable_console = logging_settings.get("enable_console_logging", True)
-    console_level = logging_settings.get("console_log_level", "WARNING")
-    enable_file = logging_settings.get("enable_file_logging", True)
-    file_level = logging_settings.get("file_log_level", "INFO")
+    return (
+        logging_settings.get("enable_console_logging", True),
+        logging_settings.get("console_log_level", "WARNING"),
+        logging_settings.get("enable_file_logging", True),
+        logging_settings.get("file_log_level", "INFO"),
+    )
+
+
+def configure_logging_from_settings(settings_manager) -> tuple:
+    """Configure logging based on settings manager.
+
+    Returns the fingerprint of the applied settings (see get_logging_fingerprint).
+    """
+    fingerprint = get_logging_fingerprint(settings_manager)
+    enable_console, console_level, enable_file, file_level = fingerprint
     
     logger.configure_logging(
         enable_console=enable_console,
@@ -207,4 +220,5 @@ def configure_logging_from_settings(settings_manager):
     )
     
     info(f"Logging reconfigured: Console={console_level} (enabled={enable_console}), "
-         f"File={file_level} (enabled={enable_file})")
\ No newline at end of file
+         f"File={file_level} (enabled={enable_file})")
+    return fingerprint
\ No newline at end of file
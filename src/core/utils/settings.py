@@ -47,6 +47,8 @@ class SettingsManager:
         self.settings_dir = self._get_settings_directory()
         self.settings_file = self.settings_dir / "preferences.toml"
         self._settings = self._get_default_settings()
+        # True while the in-memory settings differ from the settings file
+        self._dirty = True
         
         # Ensure settings directory exists
         self.settings_dir.mkdir(parents=True, exist_ok=True)
@@ -127,6 +129,7 @@ class SettingsManager:
             
             # Merge loaded settings with defaults (in case new settings were added)
             self._merge_settings(loaded_settings)
+            self._dirty = False
             info(f"Settings loaded from {self.settings_file}")
             return True
             
@@ -139,11 +142,17 @@ class SettingsManager:
         if not tomli_w:
             error("TOML writer library not available. Cannot save settings.")
             return False
+
+        # Nothing changed since the last load or save
+        if not self._dirty:
+            debug("Settings unchanged, skipping save")
+            return True
         
         try:
             with open(self.settings_file, 'wb') as f:
                 tomli_w.dump(self._settings, f)
             
+            self._dirty = False
             debug(f"Settings saved to {self.settings_file}")
             return True
             
@@ -172,9 +181,10 @@ class SettingsManager:
     
     def set(self, section: str, key: str, value: Any):
         """Set a setting value."""
-        if section not in self._settings:
-            self._settings[section] = {}
-        self._settings[section][key] = value
+        values = self._settings.setdefault(section, {})
+        if key not in values or values[key] != value:
+            values[key] = value
+            self._dirty = True
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get all settings for a section."""
@@ -182,7 +192,9 @@ class SettingsManager:
     
     def set_section(self, section: str, values: Dict[str, Any]):
         """Set all values for a section."""
-        self._settings[section] = values
+        if self._settings.get(section) != values:
+            self._settings[section] = values
+            self._dirty = True
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings."""
@@ -191,6 +203,7 @@ class SettingsManager:
     def reset_to_defaults(self):
         """Reset all settings to defaults."""
         self._settings = self._get_default_settings()
+        self._dirty = True
         info("Settings reset to defaults")
     
     def get_log_levels(self) -> list:
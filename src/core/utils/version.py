@@ -101,7 +101,7 @@ def get_app_name() -> str:
 
 def get_app_title() -> str:
     """Get the application title with version."""
-    version = get_version()
+    version = get_cached_version()
     return f"GNSSSignalSim GUI v{version}"
 
 
@@ -11,7 +11,7 @@ Based on Config File Generation Steps.md workflow requirements.
 """
 
 from enum import Enum
-from typing import Dict, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -56,6 +56,7 @@ class WorkflowManager(QObject):
     step_status_changed = pyqtSignal(WorkflowStep, ValidationStatus, str)
     workflow_progress_changed = pyqtSignal(int)  # Overall progress percentage
     tab_state_changed = pyqtSignal(str, bool)  # tab_name, enabled
+    workflow_changed = pyqtSignal()  # Several steps updated at once
     
     def __init__(self):
         super().__init__()
@@ -126,6 +127,27 @@ class WorkflowManager(QObject):
         
         debug(f"Updated {step.value}: {status.value} - {message}")
 
+    def update_steps_bulk(self, results: List[Tuple[WorkflowStep, ValidationStatus, str, int]]):
+        """Update several steps at once from (step, status, message, completion) tuples.
+
+        Every step is given a fresh result, so dependent-step resets are not
+        needed; tab states, progress and workflow_changed are emitted once.
+        """
+        for step, status, message, completion_percentage in results:
+            step_status = self.step_statuses.get(step)
+            if step_status is None:
+                continue
+            step_status.status = status
+            step_status.message = message
+            step_status.details = ""
+            step_status.completion_percentage = completion_percentage
+            step_status.can_proceed = self._can_step_proceed(step, status)
+            debug(f"Updated {step.value}: {status.value} - {message}")
+
+        self._update_tab_states()
+        self._update_overall_progress()
+        self.workflow_changed.emit()
+
     def _can_step_proceed(self, step: WorkflowStep, status: ValidationStatus) -> bool:
         """Determine if a step allows proceeding to next steps."""
         if step == WorkflowStep.BASIC_INFO:
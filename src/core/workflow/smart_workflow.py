@@ -17,17 +17,7 @@ from dataclasses import dataclass
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 from ..utils.logger import debug, info
-
-
-class WorkflowStep(Enum):
-    """Workflow steps in GNSSSignalSim configuration."""
-    BASIC_INFO = "basic_info"
-    EPHEMERIS_LOADING = "ephemeris_loading"
-    TIME_VALIDATION = "time_validation"
-    TRAJECTORY_CONFIG = "trajectory_config"
-    SIGNAL_SELECTION = "signal_selection"
-    POWER_CONFIG = "power_config"
-    OUTPUT_SETTINGS = "output_settings"
+from .manager import WorkflowStep
 
 
 class ValidationLevel(Enum):
@@ -9,14 +9,15 @@ This module provides the preferences dialog for application settings.
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QTabWidget, QWidget,
-    QLineEdit, QSpinBox, QCheckBox, QComboBox,
+    QSpinBox, QCheckBox, QComboBox,
     QGroupBox, QFormLayout, QDialogButtonBox,
-    QHBoxLayout, QPushButton, QLabel, QFileDialog
+    QLabel, QFileDialog
 )
 from PyQt6.QtCore import pyqtSignal
 
 from core.utils.logger import info
 from core.utils.settings import get_settings_manager, LogLevel
+from gui.widgets.path_picker import PathPickerWidget
 
 
 class PreferencesDialog(QDialog):
@@ -24,6 +25,14 @@ class PreferencesDialog(QDialog):
     
     preferences_changed = pyqtSignal()
     
+    # Fixed combo box choices and their {value: index} lookups
+    VALIDATION_LEVELS = ["Basic", "Standard", "Strict"]
+    THEMES = ["System", "Light", "Dark"]
+    FONT_FAMILIES = ["System Default", "Arial", "Helvetica", "Times New Roman"]
+    _validation_level_index = {v: i for i, v in enumerate(VALIDATION_LEVELS)}
+    _theme_index = {v: i for i, v in enumerate(THEMES)}
+    _font_family_index = {v: i for i, v in enumerate(FONT_FAMILIES)}
+    
     def __init__(self, parent=None):
         """Initialize the preferences dialog."""
         super().__init__(parent)
@@ -45,11 +54,16 @@ class PreferencesDialog(QDialog):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self.create_general_tab()
-        self.create_appearance_tab()
-        self.create_paths_tab()
-        self.create_logging_tab()
+        # Create tabs with updates suspended so the form rows are laid out once
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self.create_general_tab()
+            self.create_appearance_tab()
+            self.create_paths_tab()
+            self.create_logging_tab()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+        layout.activate()
         
         # Button box
         button_box = QDialogButtonBox(
@@ -90,7 +104,7 @@ class PreferencesDialog(QDialog):
         validation_layout.addRow(self.real_time_validation)
         
         self.validation_level = QComboBox()
-        self.validation_level.addItems(["Basic", "Standard", "Strict"])
+        self.validation_level.addItems(self.VALIDATION_LEVELS)
         validation_layout.addRow("Validation level:", self.validation_level)
         
         layout.addWidget(validation_group)
@@ -108,7 +122,7 @@ class PreferencesDialog(QDialog):
         theme_layout = QFormLayout(theme_group)
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["System", "Light", "Dark"])
+        self.theme_combo.addItems(self.THEMES)
         theme_layout.addRow("Theme:", self.theme_combo)
         
         layout.addWidget(theme_group)
@@ -118,7 +132,7 @@ class PreferencesDialog(QDialog):
         font_layout = QFormLayout(font_group)
         
         self.font_family = QComboBox()
-        self.font_family.addItems(["System Default", "Arial", "Helvetica", "Times New Roman"])
+        self.font_family.addItems(self.FONT_FAMILIES)
         font_layout.addRow("Font family:", self.font_family)
         
         self.font_size = QSpinBox()
@@ -140,58 +154,31 @@ class PreferencesDialog(QDialog):
         paths_layout = QFormLayout(paths_group)
         
         # Default config path
-        config_path_layout = QHBoxLayout()
-        self.default_config_path = QLineEdit()
-        self.default_config_path.setPlaceholderText("data/configs")
-        config_path_layout.addWidget(self.default_config_path)
-        
-        self.browse_config_button = QPushButton("Browse...")
-        self.browse_config_button.setMaximumWidth(80)
-        self.browse_config_button.clicked.connect(self.browse_config_path)
-        config_path_layout.addWidget(self.browse_config_button)
-        
-        paths_layout.addRow("Default config path:", config_path_layout)
+        self.default_config_path = PathPickerWidget(placeholder="data/configs")
+        paths_layout.addRow("Default config path:", self.default_config_path)
         
         # Default ephemeris path
-        ephemeris_path_layout = QHBoxLayout()
-        self.default_ephemeris_path = QLineEdit()
-        self.default_ephemeris_path.setPlaceholderText("data/ephemeris")
-        ephemeris_path_layout.addWidget(self.default_ephemeris_path)
-        
-        self.browse_ephemeris_button = QPushButton("Browse...")
-        self.browse_ephemeris_button.setMaximumWidth(80)
-        self.browse_ephemeris_button.clicked.connect(self.browse_ephemeris_path)
-        ephemeris_path_layout.addWidget(self.browse_ephemeris_button)
-        
-        paths_layout.addRow("Default ephemeris path:", ephemeris_path_layout)
+        self.default_ephemeris_path = PathPickerWidget(placeholder="data/ephemeris")
+        paths_layout.addRow("Default ephemeris path:", self.default_ephemeris_path)
         
         # Default IFDataGen executable path
-        ifdatagen_path_layout = QHBoxLayout()
-        self.default_ifdatagen_path = QLineEdit()
-        self.default_ifdatagen_path.setPlaceholderText("data/ifdatagen")
-        ifdatagen_path_layout.addWidget(self.default_ifdatagen_path)
-        
-        self.browse_ifdatagen_button = QPushButton("Browse...")
-        self.browse_ifdatagen_button.setMaximumWidth(80)
-        self.browse_ifdatagen_button.clicked.connect(self.browse_ifdatagen_path)
-        ifdatagen_path_layout.addWidget(self.browse_ifdatagen_button)
-        
-        paths_layout.addRow("Default IFDataGen path:", ifdatagen_path_layout)
+        self.default_ifdatagen_path = PathPickerWidget(placeholder="data/ifdatagen")
+        paths_layout.addRow("Default IFDataGen path:", self.default_ifdatagen_path)
         
         # Default generated outputs path
-        generated_path_layout = QHBoxLayout()
-        self.default_generated_path = QLineEdit()
-        self.default_generated_path.setPlaceholderText("data/generated")
-        generated_path_layout.addWidget(self.default_generated_path)
-        
-        self.browse_generated_button = QPushButton("Browse...")
-        self.browse_generated_button.setMaximumWidth(80)
-        self.browse_generated_button.clicked.connect(self.browse_generated_path)
-        generated_path_layout.addWidget(self.browse_generated_button)
+        self.default_generated_path = PathPickerWidget(placeholder="data/generated")
+        paths_layout.addRow("Default generated path:", self.default_generated_path)
+        
+        # Directory dialog titles for each path picker
+        self._path_dialog_titles = {
+            self.default_config_path: "Select Default Configuration Directory",
+            self.default_ephemeris_path: "Select Default Ephemeris Directory",
+            self.default_ifdatagen_path: "Select Default IFDataGen Directory",
+            self.default_generated_path: "Select Default Generated Outputs Directory",
+        }
+        for picker in self._path_dialog_titles:
+            picker.pathRequested.connect(self._pick_directory)
         
-        paths_layout.addRow("Default generated path:", generated_path_layout)
-        
-          
         layout.addWidget(paths_group)
         
         # Add info section
@@ -269,55 +256,17 @@ class PreferencesDialog(QDialog):
         layout.addStretch()
         self.tab_widget.addTab(tab, "Logging")
     
-    def browse_config_path(self):
-        """Browse for default config directory."""
-        current_path = self.default_config_path.text() or "."
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Default Configuration Directory",
-            current_path,
-            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
-        )
-        if directory:
-            self.default_config_path.setText(directory)
-    
-    def browse_ephemeris_path(self):
-        """Browse for default ephemeris directory."""
-        current_path = self.default_ephemeris_path.text() or "."
+    def _pick_directory(self, current_path):
+        """Browse for a default directory for the requesting path picker."""
+        picker = self.sender()
         directory = QFileDialog.getExistingDirectory(
             self,
-            "Select Default Ephemeris Directory",
-            current_path,
+            self._path_dialog_titles[picker],
+            current_path or ".",
             QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
         )
         if directory:
-            self.default_ephemeris_path.setText(directory)
-    
-    
-    def browse_ifdatagen_path(self):
-        """Browse for default IFDataGen directory."""
-        current_path = self.default_ifdatagen_path.text() or "."
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Default IFDataGen Directory",
-            current_path,
-            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
-        )
-        if directory:
-            self.default_ifdatagen_path.setText(directory)
-    
-    def browse_generated_path(self):
-        """Browse for default generated outputs directory."""
-        current_path = self.default_generated_path.text() or "."
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Default Generated Outputs Directory",
-            current_path,
-            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
-        )
-        if directory:
-            self.default_generated_path.setText(directory)
-    
+            picker.setText(directory)
     
     def load_preferences(self):
         """Load preferences from settings."""
@@ -326,12 +275,16 @@ class PreferencesDialog(QDialog):
         self.auto_save_enabled.setChecked(general_settings.get("auto_save_enabled", True))
         self.auto_save_interval.setValue(general_settings.get("auto_save_interval", 5))
         self.real_time_validation.setChecked(general_settings.get("real_time_validation", True))
-        self.validation_level.setCurrentText(general_settings.get("validation_level", "Standard"))
+        self.validation_level.setCurrentIndex(
+            self._validation_level_index.get(general_settings.get("validation_level"), 1)
+        )
         
         # Appearance tab
         appearance_settings = self.settings_manager.get_section("appearance")
-        self.theme_combo.setCurrentText(appearance_settings.get("theme", "System"))
-        self.font_family.setCurrentText(appearance_settings.get("font_family", "System Default"))
+        self.theme_combo.setCurrentIndex(self._theme_index.get(appearance_settings.get("theme"), 0))
+        self.font_family.setCurrentIndex(
+            self._font_family_index.get(appearance_settings.get("font_family"), 0)
+        )
         self.font_size.setValue(appearance_settings.get("font_size", 10))
         
         # Paths tab
@@ -374,8 +327,9 @@ class PreferencesDialog(QDialog):
         self.settings_manager.set_section("paths", {
             "default_config_path": self.default_config_path.text(),
             "default_ephemeris_path": self.default_ephemeris_path.text(),
+            "default_ifdatagen_path": self.default_ifdatagen_path.text(),
             "default_generated_path": self.default_generated_path.text(),
-            "ifdatagen_executable_path": self.ifdatagen_executable_path.text()
+            "ifdatagen_executable_path": self.settings_manager.get("paths", "ifdatagen_executable_path", "")
         })
         
         # Save logging settings
@@ -28,6 +28,9 @@ class SignalPowerDialog(QDialog):
 
     signal_power_changed = pyqtSignal(object)  # SignalPower
 
+    # Combo index for each constellation, matching the order items are added
+    _system_index = {t: i for i, t in enumerate(ConstellationType)}
+
     def __init__(self, parent=None, signal_power=None):
         super().__init__(parent)
         self.signal_power = signal_power or SignalPower(
@@ -82,10 +85,7 @@ class SignalPowerDialog(QDialog):
         layout.addLayout(button_layout)
 
     def load_signal_power_data(self):
-        for i in range(self.system_combo.count()):
-            if self.system_combo.itemData(i) == self.signal_power.system:
-                self.system_combo.setCurrentIndex(i)
-                break
+        self.system_combo.setCurrentIndex(self._system_index[self.signal_power.system])
 
         svid_text = ", ".join(map(str, self.signal_power.svid))
         self.svid_edit.setText(svid_text)
@@ -116,9 +116,16 @@ class SignalPowerDialog(QDialog):
         self.power_table.setCellWidget(row_position, 2, value_spin)
 
         remove_button = QPushButton("Remove")
-        remove_button.clicked.connect(lambda: self.power_table.removeRow(row_position))
+        remove_button.clicked.connect(self._on_remove_clicked)
         self.power_table.setCellWidget(row_position, 3, remove_button)
 
+    def _on_remove_clicked(self):
+        """Remove the row whose Remove button was clicked."""
+        button = self.sender()
+        row = self.power_table.indexAt(button.pos()).row()
+        if row >= 0:
+            self.power_table.removeRow(row)
+
     def accept_changes(self):
         system = self.system_combo.currentData()
         svid_text = self.svid_edit.text()
@@ -7,6 +7,8 @@ GitHub: https://github.com/MuhammadQaisarAli
 This dialog allows users to load, save, and manage configuration templates.
 """
 
+import copy
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -14,21 +16,82 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QGroupBox,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QLineEdit,
     QTextEdit,
     QLabel,
     QMessageBox,
     QSplitter,
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QAbstractListModel, QModelIndex
 from PyQt6.QtGui import QFont
 
 from core.config.templates import template_manager
 from core.utils.logger import info, debug, log_button_click
 
 
+# Stylesheet shared by all dialog instances
+_GREEN_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+"""
+
+
+class TemplateListModel(QAbstractListModel):
+    """List model of template names and whether each is built-in."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (name, is_built_in)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        name, is_built_in = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            prefix = "Built-in template: " if is_built_in else "Custom template: "
+            return prefix + name
+        return None
+
+    def set_rows(self, rows):
+        """Replace all rows with a list of (name, is_built_in) tuples.
+
+        Returns True if the model was reset, False if the rows were unchanged.
+        """
+        if rows == self._rows:
+            return False
+
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        return True
+
+    def name_at(self, row):
+        """Get the template name for a row."""
+        return self._rows[row][0]
+
+
 class TemplateDialog(QDialog):
     """Dialog for managing configuration templates."""
 
@@ -38,9 +101,17 @@ class TemplateDialog(QDialog):
         super().__init__(parent)
         self.current_config = current_config
         self.selected_template = None
+        self._built_in_names = frozenset()
+        self._info_cache = {}
         self.init_ui()
         self.refresh_template_list()
 
+    def set_config(self, current_config):
+        """Point a reused dialog at the current configuration and reload templates."""
+        self.current_config = current_config
+        self.selected_template = None
+        self.refresh_template_list()
+
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("Configuration Templates")
@@ -72,8 +143,12 @@ class TemplateDialog(QDialog):
         self.template_list_widget = QGroupBox("Available Templates")
         list_layout = QVBoxLayout(self.template_list_widget)
 
-        self.template_list = QListWidget()
-        self.template_list.itemSelectionChanged.connect(self.on_template_selected)
+        self.template_model = TemplateListModel(self)
+        self.template_list = QListView()
+        self.template_list.setModel(self.template_model)
+        self.template_list.selectionModel().selectionChanged.connect(
+            self.on_template_selected
+        )
         list_layout.addWidget(self.template_list)
 
         # List action buttons
@@ -146,23 +221,7 @@ class TemplateDialog(QDialog):
         self.load_button = QPushButton("Load Template")
         self.load_button.clicked.connect(self.load_template)
         self.load_button.setEnabled(False)
-        self.load_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        self.load_button.setStyleSheet(_GREEN_BUTTON_QSS)
         self.button_layout.addWidget(self.load_button)
 
         self.button_layout.addStretch()
@@ -174,35 +233,32 @@ class TemplateDialog(QDialog):
     def refresh_template_list(self):
         """Refresh the template list."""
         log_button_click("Refresh Template List", "Template Dialog")
-        self.template_list.clear()
 
+        self._built_in_names = frozenset(template_manager.get_built_in_template_names())
+        # List the templates directory once so the rows and details agree
         template_names = template_manager.get_template_names()
+        self._info_cache = template_manager.get_all_template_infos(template_names)
         debug(f"Found {len(template_names)} templates")
 
-        for name in template_names:
-            item = QListWidgetItem(name)
-
-            # Add icon or styling for built-in vs custom templates
-            if template_manager.is_built_in_template(name):
-                item.setToolTip(f"Built-in template: {name}")
-                # You could add an icon here: item.setIcon(built_in_icon)
-            else:
-                item.setToolTip(f"Custom template: {name}")
-                # You could add an icon here: item.setIcon(custom_icon)
-
-            self.template_list.addItem(item)
+        # Only reset the view when the list itself changed; otherwise keep the
+        # selection and re-read its details from the refreshed cache
+        if self.template_model.set_rows(
+            [(name, name in self._built_in_names) for name in template_names]
+        ):
+            self.clear_template_details()
+        else:
+            self.on_template_selected()
 
         info(f"Template list refreshed: {len(template_names)} templates available")
 
     def on_template_selected(self):
         """Handle template selection."""
-        selected_items = self.template_list.selectedItems()
-        if not selected_items:
+        template_name = self.selected_template_name()
+        if template_name is None:
             self.clear_template_details()
             return
 
-        template_name = selected_items[0].text()
-        template_info = template_manager.get_template_info(template_name)
+        template_info = self._info_cache.get(template_name)
 
         if template_info:
             self.name_label.setText(template_info["name"])
@@ -212,14 +268,19 @@ class TemplateDialog(QDialog):
 
             # Enable/disable buttons based on template type
             self.load_button.setEnabled(True)
-            self.delete_button.setEnabled(
-                not template_manager.is_built_in_template(template_name)
-            )
+            self.delete_button.setEnabled(template_name not in self._built_in_names)
 
             debug(f"Selected template: {template_name}")
         else:
             self.clear_template_details()
 
+    def selected_template_name(self):
+        """Get the name of the selected template, or None."""
+        indexes = self.template_list.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return self.template_model.name_at(indexes[0].row())
+
     def clear_template_details(self):
         """Clear template details display."""
         self.name_label.setText("No template selected")
@@ -231,11 +292,10 @@ class TemplateDialog(QDialog):
 
     def load_template(self):
         """Load the selected template."""
-        selected_items = self.template_list.selectedItems()
-        if not selected_items:
+        template_name = self.selected_template_name()
+        if template_name is None:
             return
 
-        template_name = selected_items[0].text()
         log_button_click(f"Load Template: {template_name}", "Template Dialog")
 
         template_config = template_manager.get_template(template_name)
@@ -278,7 +338,7 @@ class TemplateDialog(QDialog):
         log_button_click(f"Save Template: {template_name}", "Template Dialog")
 
         # Create a copy of the current config for the template
-        template_config = SignalSimConfig.from_dict(self.current_config.to_dict())
+        template_config = copy.deepcopy(self.current_config)
         template_config.description = f"Custom template: {template_name}"
         template_config.comment = "Saved from current configuration"
 
@@ -298,12 +358,10 @@ class TemplateDialog(QDialog):
 
     def delete_template(self):
         """Delete the selected template."""
-        selected_items = self.template_list.selectedItems()
-        if not selected_items:
+        template_name = self.selected_template_name()
+        if template_name is None:
             return
 
-        template_name = selected_items[0].text()
-
         # Confirm deletion
         reply = QMessageBox.question(
             self,
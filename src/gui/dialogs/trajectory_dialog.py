@@ -19,19 +19,105 @@ from PyQt6.QtWidgets import (
     QLabel,
     QMessageBox,
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QTimer
 from core.config.models import TrajectorySegment, TrajectoryType
 from core.utils.logger import info, log_button_click
 
 
+# Stylesheets shared by all dialog instances
+_DESC_LABEL_QSS = """
+    QLabel {
+        background-color: #f8f9fa;
+        color: #212529;
+        padding: 10px;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+"""
+
+_GREEN_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+
+
 class TrajectorySegmentDialog(QDialog):
     """Dialog for adding/editing trajectory segments."""
 
     segment_created = pyqtSignal(object)  # TrajectorySegment
 
+    # Value rows in form order: key -> (label, minimum, maximum, suffix)
+    _ROW_SPECS = {
+        "time": ("Duration:", 0.001, 3600.0, " s"),
+        "acceleration": ("Acceleration:", -100.0, 100.0, " m/s²"),
+        "speed": ("Speed:", 0, 1000.0, " m/s"),
+        "rate": ("Rate:", -100.0, 100.0, " m/s³"),
+        "angle": ("Angle:", -360.0, 360.0, " °"),
+        "radius": ("Radius:", 0, 10000.0, " m"),
+    }
+    _VALUE_KEYS = tuple(_ROW_SPECS)
+
+    # Value row shown for each word in a parameter selection
+    _SELECTION_WORDS = {
+        "Duration": "time",
+        "Acceleration": "acceleration",
+        "Speed": "speed",
+        "Rate": "rate",
+        "Angle": "angle",
+        "Radius": "radius",
+    }
+
+    # Parameter selector used by each trajectory type
+    _SELECTOR_KEYS = {
+        TrajectoryType.CONST_ACC: "const_acc",
+        TrajectoryType.VERTICAL_ACC: "const_acc",
+        TrajectoryType.JERK: "jerk",
+        TrajectoryType.HORIZONTAL_TURN: "horz_turn",
+    }
+
+    # Description format strings keyed by (trajectory type, parameter selection)
+    _CONST_ACC_TEMPLATES = {
+        "Duration & Acceleration": "<b>Constant Acceleration:</b><br>Accelerate at {acceleration:.3f} m/s² for {time:.3f} seconds.",
+        "Duration & Speed": "<b>Constant Acceleration:</b><br>Accelerate to a final speed of {speed:.3f} m/s over {time:.3f} seconds.",
+        "Acceleration & Speed": "<b>Constant Acceleration:</b><br>Accelerate at {acceleration:.3f} m/s² until a final speed of {speed:.3f} m/s is reached.",
+    }
+    _DESC_TEMPLATES = {
+        (TrajectoryType.CONST, None): "<b>Constant Velocity:</b><br>Move at a constant speed for {time:.3f} seconds.",
+        **{(TrajectoryType.CONST_ACC, k): v for k, v in _CONST_ACC_TEMPLATES.items()},
+        **{(TrajectoryType.VERTICAL_ACC, k): v for k, v in _CONST_ACC_TEMPLATES.items()},
+        (TrajectoryType.JERK, "Duration & Rate"): "<b>Jerk:</b><br>Apply a jerk rate of {rate:.3f} m/s³ for {time:.3f} seconds.",
+        (TrajectoryType.JERK, "Duration & Acceleration"): "<b>Jerk:</b><br>Apply jerk to reach a final acceleration of {acceleration:.3f} m/s² over {time:.3f} seconds.",
+        (TrajectoryType.JERK, "Rate & Acceleration"): "<b>Jerk:</b><br>Apply a jerk rate of {rate:.3f} m/s³ until a final acceleration of {acceleration:.3f} m/s² is reached.",
+        (TrajectoryType.HORIZONTAL_TURN, "Duration & Angle"): "<b>Horizontal Turn:</b><br>Turn by {angle:.3f}° over {time:.3f} seconds.",
+        (TrajectoryType.HORIZONTAL_TURN, "Duration & Acceleration"): "<b>Horizontal Turn:</b><br>Turn with a centripetal acceleration of {acceleration:.3f} m/s² for {time:.3f} seconds.",
+        (TrajectoryType.HORIZONTAL_TURN, "Duration & Rate"): "<b>Horizontal Turn:</b><br>Turn at a rate of {rate:.3f}°/s for {time:.3f} seconds.",
+        (TrajectoryType.HORIZONTAL_TURN, "Duration & Radius"): "<b>Horizontal Turn:</b><br>Turn with a radius of {radius:.3f} m for {time:.3f} seconds.",
+        (TrajectoryType.HORIZONTAL_TURN, "Angle & Acceleration"): "<b>Horizontal Turn:</b><br>Turn by {angle:.3f}° with a centripetal acceleration of {acceleration:.3f} m/s².",
+        (TrajectoryType.HORIZONTAL_TURN, "Angle & Rate"): "<b>Horizontal Turn:</b><br>Turn by {angle:.3f}° at a rate of {rate:.3f}°/s.",
+        (TrajectoryType.HORIZONTAL_TURN, "Angle & Radius"): "<b>Horizontal Turn:</b><br>Turn by {angle:.3f}° with a radius of {radius:.3f} m.",
+    }
+
     def __init__(self, parent=None, segment=None):
         super().__init__(parent)
         self.segment = segment or TrajectorySegment()
+        self._last_applied = None  # (trajectory type, selection) shown in the form
+
+        # Coalesce bursts of spinbox changes into a single description update
+        self._desc_timer = QTimer(self)
+        self._desc_timer.setSingleShot(True)
+        self._desc_timer.setInterval(50)
+        self._desc_timer.timeout.connect(self._do_update_description)
+
         self.init_ui()
         self.load_segment_data()
 
@@ -109,32 +195,10 @@ class TrajectorySegmentDialog(QDialog):
             self.on_param_selection_changed
         )
 
-        # Spinboxes
-        self.time_spin = self._create_spinbox(0.001, 3600.0, 3, " s")
-        self.rows["time"] = (QLabel("Duration:"), self.time_spin)
-        segment_layout.addRow(self.rows["time"][0], self.rows["time"][1])
-
-        self.acceleration_spin = self._create_spinbox(-100.0, 100.0, 3, " m/s²")
-        self.rows["acceleration"] = (QLabel("Acceleration:"), self.acceleration_spin)
-        segment_layout.addRow(
-            self.rows["acceleration"][0], self.rows["acceleration"][1]
-        )
-
-        self.speed_spin = self._create_spinbox(0, 1000.0, 3, " m/s")
-        self.rows["speed"] = (QLabel("Speed:"), self.speed_spin)
-        segment_layout.addRow(self.rows["speed"][0], self.rows["speed"][1])
-
-        self.rate_spin = self._create_spinbox(-100.0, 100.0, 3, " m/s³")
-        self.rows["rate"] = (QLabel("Rate:"), self.rate_spin)
-        segment_layout.addRow(self.rows["rate"][0], self.rows["rate"][1])
-
-        self.angle_spin = self._create_spinbox(-360.0, 360.0, 3, " °")
-        self.rows["angle"] = (QLabel("Angle:"), self.angle_spin)
-        segment_layout.addRow(self.rows["angle"][0], self.rows["angle"][1])
-
-        self.radius_spin = self._create_spinbox(0, 10000.0, 3, " m")
-        self.rows["radius"] = (QLabel("Radius:"), self.radius_spin)
-        segment_layout.addRow(self.rows["radius"][0], self.rows["radius"][1])
+        # Value rows are created on first use; see set_row_visible()
+        self.segment_layout = segment_layout
+        self._first_value_row = segment_layout.rowCount()
+        self._values = dict.fromkeys(self._VALUE_KEYS, 0.0)
 
         layout.addWidget(segment_group)
 
@@ -144,16 +208,7 @@ class TrajectorySegmentDialog(QDialog):
 
         self.description_label = QLabel()
         self.description_label.setWordWrap(True)
-        self.description_label.setStyleSheet("""
-            QLabel {
-                background-color: #f8f9fa;
-                color: #212529;
-                padding: 10px;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-        """)
+        self.description_label.setStyleSheet(_DESC_LABEL_QSS)
         desc_layout.addWidget(self.description_label)
 
         layout.addWidget(desc_group)
@@ -170,26 +225,13 @@ class TrajectorySegmentDialog(QDialog):
         self.ok_button = QPushButton("OK")
         self.ok_button.clicked.connect(self.accept_segment)
         self.ok_button.setDefault(True)
-        self.ok_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.ok_button.setStyleSheet(_GREEN_BUTTON_QSS)
         button_layout.addWidget(self.ok_button)
 
         layout.addLayout(button_layout)
 
         # Update description initially
-        self.update_description()
-        self.connect_value_signals()
+        self._do_update_description()
 
     def _create_spinbox(self, min_val, max_val, decimals, suffix):
         """Helper to create and configure a QDoubleSpinBox."""
@@ -199,187 +241,164 @@ class TrajectorySegmentDialog(QDialog):
         spin.setSuffix(suffix)
         return spin
 
+    def _create_value_row(self, key):
+        """Create a value spinbox row and insert it at its place in the form."""
+        label_text, min_val, max_val, suffix = self._ROW_SPECS[key]
+        spin = self._create_spinbox(min_val, max_val, 3, suffix)
+        spin.setValue(self._values[key])
+        spin.valueChanged.connect(self.update_description)
+
+        # Keep rows in _ROW_SPECS order regardless of creation order
+        position = self._VALUE_KEYS.index(key)
+        index = self._first_value_row + sum(
+            1 for k in self._VALUE_KEYS[:position] if k in self.rows
+        )
+        self.rows[key] = (QLabel(label_text), spin)
+        self.segment_layout.insertRow(index, self.rows[key][0], spin)
+
+    def _row_shown(self, row_key):
+        """Check whether a form row exists and is not hidden."""
+        return row_key in self.rows and not self.rows[row_key][0].isHidden()
+
     def set_row_visible(self, row_key, visible):
-        """Show or hide a form row."""
-        if row_key in self.rows:
-            self.rows[row_key][0].setVisible(visible)
-            self.rows[row_key][1].setVisible(visible)
+        """Show or hide a form row, creating value rows on first show."""
+        if row_key not in self.rows:
+            if not visible or row_key not in self._ROW_SPECS:
+                return
+            self._create_value_row(row_key)
+
+        self.rows[row_key][0].setVisible(visible)
+        self.rows[row_key][1].setVisible(visible)
 
     def load_segment_data(self):
         """Load segment data into the form."""
         if not self.segment:
             return
 
-        # Set trajectory type
-        type_index = self.type_combo.findData(self.segment.type)
-        if type_index >= 0:
-            self.type_combo.setCurrentIndex(type_index)
+        self._values = {
+            key: getattr(self.segment, key) or 0 for key in self._VALUE_KEYS
+        }
 
-        # Set values, which will trigger UI updates
-        self.time_spin.setValue(self.segment.time or 0)
-        self.acceleration_spin.setValue(self.segment.acceleration or 0)
-        self.speed_spin.setValue(self.segment.speed or 0)
-        self.rate_spin.setValue(self.segment.rate or 0)
-        self.angle_spin.setValue(self.segment.angle or 0)
-        self.radius_spin.setValue(self.segment.radius or 0)
+        # Block signals while loading so the UI is updated once at the end
+        widgets = [self.type_combo] + [
+            self.rows[key][1] for key in self._VALUE_KEYS if key in self.rows
+        ]
+        for widget in widgets:
+            widget.blockSignals(True)
+
+        try:
+            # Set trajectory type
+            type_index = self.type_combo.findData(self.segment.type)
+            if type_index >= 0:
+                self.type_combo.setCurrentIndex(type_index)
+
+            # Set values on rows that already exist; the rest pick them up when created
+            for key in self._VALUE_KEYS:
+                if key in self.rows:
+                    self.rows[key][1].setValue(self._values[key])
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
 
         # Set parameter selectors based on which values are present
         self.on_type_changed()
 
+    def _apply_row_visibility(self, keys, visible_keys):
+        """Show exactly visible_keys among keys, touching only rows that change."""
+        self.setUpdatesEnabled(False)
+        try:
+            for key in keys:
+                visible = key in visible_keys
+                if self._row_shown(key) != visible:
+                    self.set_row_visible(key, visible)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def on_type_changed(self):
         """Handle trajectory type change."""
         traj_type = self.type_combo.currentData()
 
-        # Hide all parameter selectors and rows initially
-        for key in self.param_selectors:
-            self.set_row_visible(f"{key}_selector", False)
-
-        for key in ["time", "acceleration", "speed", "rate", "angle", "radius"]:
-            self.set_row_visible(key, False)
-
-        # Show relevant controls based on trajectory type
-        if traj_type == TrajectoryType.CONST:
-            self.set_row_visible("time", True)
-        elif traj_type in [TrajectoryType.CONST_ACC, TrajectoryType.VERTICAL_ACC]:
-            self.set_row_visible("const_acc_selector", True)
-        elif traj_type == TrajectoryType.JERK:
-            self.set_row_visible("jerk_selector", True)
-        elif traj_type == TrajectoryType.HORIZONTAL_TURN:
-            self.set_row_visible("horz_turn_selector", True)
+        # Show only the parameter selector relevant to this trajectory type
+        self._last_applied = None
+        selector_key = self._SELECTOR_KEYS.get(traj_type)
+        self._apply_row_visibility(
+            [f"{key}_selector" for key in self.param_selectors],
+            {f"{selector_key}_selector"} if selector_key else set(),
+        )
 
         self.on_param_selection_changed()
-        self.update_description()
+
+    def _current_selection_text(self, traj_type):
+        """Get the parameter selection for a trajectory type, or None if it has none."""
+        selector_key = self._SELECTOR_KEYS.get(traj_type)
+        if selector_key is None:
+            return None
+        return self.param_selectors[selector_key].currentText()
 
     def on_param_selection_changed(self):
         """Handle change in parameter selection."""
         traj_type = self.type_combo.currentData()
+        selection = self._current_selection_text(traj_type)
+
+        # Nothing to do if this type and selection are already applied
+        applied = (traj_type, selection)
+        if applied == self._last_applied:
+            return
+        self._last_applied = applied
 
-        # Hide all spinboxes first
-        for key in ["time", "acceleration", "speed", "rate", "angle", "radius"]:
-            self.set_row_visible(key, False)
-
-        # Show spinboxes based on selection
-        if traj_type in [TrajectoryType.CONST_ACC, TrajectoryType.VERTICAL_ACC]:
-            selection = self.param_selectors["const_acc"].currentText()
-            if "Duration" in selection:
-                self.set_row_visible("time", True)
-            if "Acceleration" in selection:
-                self.set_row_visible("acceleration", True)
-            if "Speed" in selection:
-                self.set_row_visible("speed", True)
-        elif traj_type == TrajectoryType.JERK:
-            selection = self.param_selectors["jerk"].currentText()
-            if "Duration" in selection:
-                self.set_row_visible("time", True)
-            if "Rate" in selection:
-                self.set_row_visible("rate", True)
-            if "Acceleration" in selection:
-                self.set_row_visible("acceleration", True)
-        elif traj_type == TrajectoryType.HORIZONTAL_TURN:
-            selection = self.param_selectors["horz_turn"].currentText()
-            if "Duration" in selection:
-                self.set_row_visible("time", True)
-            if "Angle" in selection:
-                self.set_row_visible("angle", True)
-            if "Acceleration" in selection:
-                self.set_row_visible("acceleration", True)
-            if "Rate" in selection:
-                self.set_row_visible("rate", True)
-            if "Radius" in selection:
-                self.set_row_visible("radius", True)
-        elif traj_type == TrajectoryType.CONST:
-            self.set_row_visible("time", True)
-
-        self.update_description()
+        # Show value rows named by the selection, e.g. "Duration & Angle"
+        if traj_type == TrajectoryType.CONST:
+            visible_keys = {"time"}
+        elif selection:
+            visible_keys = {
+                key for word, key in self._SELECTION_WORDS.items() if word in selection
+            }
+        else:
+            visible_keys = set()
+        self._apply_row_visibility(self._VALUE_KEYS, visible_keys)
+
+        self._do_update_description()
 
     def update_description(self):
+        """Schedule a description update, coalescing rapid value changes."""
+        self._desc_timer.start()
+
+    def _do_update_description(self):
         """Update the description based on current settings."""
         traj_type = self.type_combo.currentData()
-        time_val = self.time_spin.value()
-        acc_val = self.acceleration_spin.value()
-        speed_val = self.speed_spin.value()
-        rate_val = self.rate_spin.value()
-        angle_val = self.angle_spin.value()
-        radius_val = self.radius_spin.value()
-
-        description = ""
-        if traj_type == TrajectoryType.CONST:
-            description = f"<b>Constant Velocity:</b><br>Move at a constant speed for {time_val:.3f} seconds."
-        elif traj_type in [TrajectoryType.CONST_ACC, TrajectoryType.VERTICAL_ACC]:
-            selection = self.param_selectors["const_acc"].currentText()
-            if selection == "Duration & Acceleration":
-                description = f"<b>Constant Acceleration:</b><br>Accelerate at {acc_val:.3f} m/s² for {time_val:.3f} seconds."
-            elif selection == "Duration & Speed":
-                description = f"<b>Constant Acceleration:</b><br>Accelerate to a final speed of {speed_val:.3f} m/s over {time_val:.3f} seconds."
-            elif selection == "Acceleration & Speed":
-                description = f"<b>Constant Acceleration:</b><br>Accelerate at {acc_val:.3f} m/s² until a final speed of {speed_val:.3f} m/s is reached."
-        elif traj_type == TrajectoryType.JERK:
-            selection = self.param_selectors["jerk"].currentText()
-            if selection == "Duration & Rate":
-                description = f"<b>Jerk:</b><br>Apply a jerk rate of {rate_val:.3f} m/s³ for {time_val:.3f} seconds."
-            elif selection == "Duration & Acceleration":
-                description = f"<b>Jerk:</b><br>Apply jerk to reach a final acceleration of {acc_val:.3f} m/s² over {time_val:.3f} seconds."
-            elif selection == "Rate & Acceleration":
-                description = f"<b>Jerk:</b><br>Apply a jerk rate of {rate_val:.3f} m/s³ until a final acceleration of {acc_val:.3f} m/s² is reached."
-        elif traj_type == TrajectoryType.HORIZONTAL_TURN:
-            selection = self.param_selectors["horz_turn"].currentText()
-            base_desc = "<b>Horizontal Turn:</b><br>"
-            if "Duration & Angle" in selection:
-                description = base_desc + f"Turn by {angle_val:.3f}° over {time_val:.3f} seconds."
-            elif "Duration & Acceleration" in selection:
-                description = base_desc + f"Turn with a centripetal acceleration of {acc_val:.3f} m/s² for {time_val:.3f} seconds."
-            elif "Duration & Rate" in selection:
-                description = base_desc + f"Turn at a rate of {rate_val:.3f}°/s for {time_val:.3f} seconds."
-            elif "Duration & Radius" in selection:
-                description = base_desc + f"Turn with a radius of {radius_val:.3f} m for {time_val:.3f} seconds."
-            elif "Angle & Acceleration" in selection:
-                description = base_desc + f"Turn by {angle_val:.3f}° with a centripetal acceleration of {acc_val:.3f} m/s²."
-            elif "Angle & Rate" in selection:
-                description = base_desc + f"Turn by {angle_val:.3f}° at a rate of {rate_val:.3f}°/s."
-            elif "Angle & Radius" in selection:
-                description = base_desc + f"Turn by {angle_val:.3f}° with a radius of {radius_val:.3f} m."
-
-        self.description_label.setText(description or "Select a trajectory type.")
-
-    def connect_value_signals(self):
-        """Connects spinbox value changes to update the description."""
-        self.time_spin.valueChanged.connect(self.update_description)
-        self.acceleration_spin.valueChanged.connect(self.update_description)
-        self.speed_spin.valueChanged.connect(self.update_description)
-        self.rate_spin.valueChanged.connect(self.update_description)
-        self.angle_spin.valueChanged.connect(self.update_description)
-        self.radius_spin.valueChanged.connect(self.update_description)
+        selection = self._current_selection_text(traj_type)
+
+        template = self._DESC_TEMPLATES.get((traj_type, selection))
+        if template is None:
+            self.description_label.setText("Select a trajectory type.")
+            return
+
+        # Only shown rows are used by the template; hidden ones default to zero
+        values = {
+            key: self.rows[key][1].value() if self._row_shown(key) else 0.0
+            for key in self._VALUE_KEYS
+        }
+        self.description_label.setText(template.format(**values))
 
     def accept_segment(self):
         """Accept the segment and emit signal."""
         log_button_click("Accept Trajectory Segment", "Trajectory Dialog")
 
         traj_type = self.type_combo.currentData()
-        time_val = self.time_spin.value()
-        acc_val = (
-            self.acceleration_spin.value()
-            if self.acceleration_spin.isEnabled()
-            else None
-        )
-        speed_val = self.speed_spin.value() if self.speed_spin.isEnabled() else None
-        rate_val = self.rate_spin.value() if self.rate_spin.isEnabled() else None
-        angle_val = self.angle_spin.value() if self.angle_spin.isEnabled() else None
-        radius_val = self.radius_spin.value() if self.radius_spin.isEnabled() else None
 
-        # Validate non-zero values for visible fields
+        # Read values only for visible rows, validating that they are non-zero
+        values = {}
         validation_errors = []
-        if self.rows["time"][0].isVisible() and self.time_spin.value() == 0.0:
-            validation_errors.append("Duration cannot be zero.")
-        if self.rows["acceleration"][0].isVisible() and self.acceleration_spin.value() == 0.0:
-            validation_errors.append("Acceleration cannot be zero.")
-        if self.rows["speed"][0].isVisible() and self.speed_spin.value() == 0.0:
-            validation_errors.append("Speed cannot be zero.")
-        if self.rows["rate"][0].isVisible() and self.rate_spin.value() == 0.0:
-            validation_errors.append("Rate cannot be zero.")
-        if self.rows["angle"][0].isVisible() and self.angle_spin.value() == 0.0:
-            validation_errors.append("Angle cannot be zero.")
-        if self.rows["radius"][0].isVisible() and self.radius_spin.value() == 0.0:
-            validation_errors.append("Radius cannot be zero.")
+        for key in self._VALUE_KEYS:
+            if key not in self.rows:
+                continue
+            label, spin = self.rows[key]
+            if not label.isVisible():
+                continue
+            value = spin.value()
+            if value == 0.0:
+                validation_errors.append(f"{label.text().rstrip(':')} cannot be zero.")
+            values[key] = value
 
         if validation_errors:
             QMessageBox.warning(
@@ -390,20 +409,7 @@ class TrajectorySegmentDialog(QDialog):
             return
 
         # Create segment with only the visible parameters
-        segment = TrajectorySegment(type=traj_type)
-
-        if self.rows["time"][0].isVisible():
-            segment.time = self.time_spin.value()
-        if self.rows["acceleration"][0].isVisible():
-            segment.acceleration = self.acceleration_spin.value()
-        if self.rows["speed"][0].isVisible():
-            segment.speed = self.speed_spin.value()
-        if self.rows["rate"][0].isVisible():
-            segment.rate = self.rate_spin.value()
-        if self.rows["angle"][0].isVisible():
-            segment.angle = self.angle_spin.value()
-        if self.rows["radius"][0].isVisible():
-            segment.radius = self.radius_spin.value()
+        segment = TrajectorySegment(type=traj_type, **values)
 
         info(f"Trajectory segment created: {segment.type.value}, {segment.time}s, acc={segment.acceleration}")
 
@@ -8,8 +8,18 @@ This module contains the main application window with tabbed interface
 and menu system.
 """
 
+import functools
+import hashlib
 import os
 import json
+import tempfile
+import time
+
+# Use orjson for faster serialization when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from PyQt6.QtWidgets import (
     QMainWindow,
@@ -21,20 +31,42 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QPushButton,
     QSplitter,
-    QTextEdit,
+    QPlainTextEdit,
     QLabel,
     QProgressBar,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import (
+    Qt,
+    QEvent,
+    QTimer,
+    QIODevice,
+    QSaveFile,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QAction, QFont, QIcon
 
 from core.config.models import GNSSSignalSimConfig, get_default_system_select
-from core.utils.logger import info, debug, log_button_click, error, configure_logging_from_settings
+from core.utils.logger import (
+    info,
+    debug,
+    log_button_click,
+    error,
+    configure_logging_from_settings,
+    get_logging_fingerprint,
+)
 from core.utils.settings import get_settings_manager, get_default_path
 from core.utils.version import get_app_title, get_cached_project_info
 from core.integration.ifdatagen import ifdatagen_integration
 from core.workflow.manager import get_workflow_manager, WorkflowStep, ValidationStatus
-from core.workflow.smart_workflow import get_smart_workflow_manager, ValidationLevel, register_smart_validation_callback
+from core.workflow.smart_workflow import (
+    get_smart_workflow_manager,
+    ValidationLevel,
+    register_smart_validation_callback,
+    update_step_feedback,
+)
 from gui.tabs.basic_tab import BasicTab
 from gui.tabs.ephemeris_time_tab import EphemerisTimeTab
 from gui.tabs.trajectory_tab import TrajectoryTab
@@ -48,12 +80,99 @@ from gui.dialogs.about import AboutDialog
 from gui.dialogs.preferences import PreferencesDialog
 
 
+_APP_ICON_PATH = "src/gui/resources/icons/gnsssignalsimgui.ico"
+_APP_ICON = None
+
+
+def _get_app_icon() -> QIcon:
+    """Load the application icon once; a null icon if the file is missing."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        if os.path.exists(_APP_ICON_PATH):
+            _APP_ICON = QIcon(_APP_ICON_PATH)
+            info(f"Application icon loaded from {_APP_ICON_PATH}")
+        else:
+            _APP_ICON = QIcon()
+            debug(f"Icon file not found at {_APP_ICON_PATH}")
+    return _APP_ICON
+
+
+@functools.lru_cache(maxsize=64)
+def _list_dir_cached(directory: str, time_bucket: int) -> frozenset:
+    """Entry names of a directory, memoized per directory and time bucket."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(os.path.normcase(entry.name) for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _bulk_exists(paths) -> dict:
+    """Map each path to whether it exists, with one directory scan per folder.
+
+    Listings are reused for about two seconds.
+    """
+    time_bucket = int(time.monotonic()) // 2
+    # Bind the per-path helpers once for the loop
+    split, normcase, exists = os.path.split, os.path.normcase, os.path.exists
+    list_dir = _list_dir_cached
+    present = {}
+    for path in paths:
+        if path in present:
+            continue
+        directory, name = split(path)
+        if not name:
+            present[path] = exists(path)
+            continue
+        present[path] = normcase(name) in list_dir(directory or os.curdir, time_bucket)
+    return present
+
+
+def _dump_json_bytes(data) -> bytes:
+    """Serialize data as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+class _PreviewEmitter(QObject):
+    """Delivers preview text from worker threads to the GUI thread."""
+
+    preview_ready = pyqtSignal(int, str)  # config version, preview text
+
+
+class _PreviewTask(QRunnable):
+    """Serializes a config dict snapshot to preview text off the GUI thread."""
+
+    def __init__(self, emitter, version, config_dict, max_lines):
+        super().__init__()
+        self.emitter = emitter
+        self.version = version
+        self.config_dict = config_dict
+        self.max_lines = max_lines
+
+    def run(self):
+        try:
+            json_text = _dump_json_bytes(self.config_dict).decode("utf-8")
+
+            # Truncate very long previews to bound the text layout cost
+            lines = json_text.split("\n", self.max_lines)
+            if len(lines) > self.max_lines:
+                remaining = lines.pop().count("\n") + 1
+                json_text = "\n".join(lines) + f"\n... ({remaining} more lines, save to see full)"
+        except Exception as e:
+            json_text = f"Error generating preview: {str(e)}"
+        self.emitter.preview_ready.emit(self.version, json_text)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
     config_changed = pyqtSignal()
 
+    # Longest JSON preview shown; the saved file always has the full config
+    PREVIEW_MAX_LINES = 2000
+
     def __init__(self):
         super().__init__()
         info("Initializing GNSSSignalSim GUI Main Window")
@@ -66,6 +185,14 @@ class MainWindow(QMainWindow):
         self.current_file = None
         self.is_modified = False
 
+        # Set while refresh_tabs runs so tab updates collapse into one change
+        self._suspend_config_signals = False
+        self._suppressed_config_change = False
+
+        # Title pieces are fixed per file, so look them up once
+        self._app_title = get_app_title()
+        self._basename_cache = {}
+
         # Initialize workflow managers
         self.workflow_manager = get_workflow_manager()  # Keep old one for compatibility
         self.smart_workflow = get_smart_workflow_manager()  # New smart workflow
@@ -74,8 +201,26 @@ class MainWindow(QMainWindow):
             f"Default configuration created with {len(self.config.output.system_select)} system selections"
         )
 
+        # Bumped on every config mutation; lets derived data be cached per version
+        self._config_version = 0
+        self._preview_version = -1
+        self._autosaved_version = -1
+        self._autosaved_digest = None
+
+        # Preview refresh timer; restarting it coalesces rapid edits into one refresh
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+
+        # Preview text is serialized on the thread pool; stale results are dropped
+        self._preview_pending_version = -1
+        # Config sections edited since the last preview; None means all of them
+        self._dirty_sections = None
+        self._preview_emitter = _PreviewEmitter(self)
+        self._preview_emitter.preview_ready.connect(self._on_preview_ready)
+
         self.init_ui()
-        self.setup_icon()
         self.setup_menu()
         self.setup_toolbar()
         self.setup_status_bar()
@@ -87,12 +232,38 @@ class MainWindow(QMainWindow):
         self.auto_save_timer = QTimer()
         self.auto_save_timer.timeout.connect(self.auto_save)
         
+        # Font last applied by apply_settings, as (family, size)
+        self._applied_font = None
+        # Logging settings last applied by apply_logging_settings
+        self._last_log_fingerprint = None
+
         # Apply settings (this will configure the auto-save timer)
         self.apply_settings()
 
+        # Legacy validator results keyed by step: (input fingerprint, result)
+        self._validator_input_hash = {}
+
+        # State of the non-blocking unsaved-changes prompt shown on close
+        self._close_confirmed = False
+        self._close_prompt_open = False
+
+        # Dialogs are built on first use and reused afterwards
+        self._prefs_dialog = None
+        self._about_dialog = None
+        self._template_dialog = None
+
+        # Coalesces bursts of preference changes into one apply_settings pass
+        self._prefs_apply_timer = QTimer(self)
+        self._prefs_apply_timer.setSingleShot(True)
+        self._prefs_apply_timer.setInterval(50)
+        self._prefs_apply_timer.timeout.connect(self._apply_changed_preferences)
+
+        # Load the icon from disk once the event loop runs, after the first paint
+        QTimer.singleShot(0, self.setup_icon)
+
     def init_ui(self):
         """Initialize the responsive user interface."""
-        self.setWindowTitle(get_app_title())
+        self.setWindowTitle(self._app_title)
 
         # Set minimum and initial window size
         self.setMinimumSize(1200, 700)
@@ -140,20 +311,28 @@ class MainWindow(QMainWindow):
         self.power_tab = PowerTab(self.config)
         self.output_settings_tab = OutputSettingsTab(self.config)
         self.generate_tab = GenerateTab(self.config)
-        self.almanac_tab = AlmanacTab(self.config)  # Keep for future use
+        self.almanac_tab = None  # Created only when the almanac tab is shown
 
         # Add tabs to widget in workflow sequence
-        self.tab_widget.addTab(self.basic_tab, "Basic")
-        self.tab_widget.addTab(self.ephemeris_time_tab, "Ephemeris and Time")
-        self.tab_widget.addTab(self.trajectory_tab, "Trajectory")
-        self.tab_widget.addTab(self.signal_selection_tab, "Signal Selection")
-        self.tab_widget.addTab(self.power_tab, "Signal Power")
-        self.tab_widget.addTab(self.output_settings_tab, "Output Settings")
-        self.tab_widget.addTab(self.generate_tab, "Generate")
-        
+        tabs = [
+            (self.basic_tab, "Basic"),
+            (self.ephemeris_time_tab, "Ephemeris and Time"),
+            (self.trajectory_tab, "Trajectory"),
+            (self.signal_selection_tab, "Signal Selection"),
+            (self.power_tab, "Signal Power"),
+            (self.output_settings_tab, "Output Settings"),
+            (self.generate_tab, "Generate"),
+        ]
+
         # Conditionally add almanac tab (hidden for now)
         if self.show_almanac_tab:
-            self.tab_widget.addTab(self.almanac_tab, "Almanac")
+            self.almanac_tab = AlmanacTab(self.config)
+            tabs.append((self.almanac_tab, "Almanac"))
+
+        # Tab name -> index, so workflow state changes avoid scanning tab texts
+        self._tab_index = {}
+        for tab, name in tabs:
+            self._tab_index[name] = self.tab_widget.addTab(tab, name)
 
     def setup_preview_panel(self):
         """Set up the JSON preview panel with size constraints."""
@@ -186,12 +365,16 @@ class MainWindow(QMainWindow):
         layout.addWidget(preview_label)
 
         # JSON preview text area
-        self.json_preview = QTextEdit()
+        self.json_preview = QPlainTextEdit()
         self.json_preview.setReadOnly(True)
         self.json_preview.setFont(QFont("Consolas", 9))
-        self.json_preview.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.json_preview.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        # Read-only view: keep no undo history, and bound the document to the
+        # truncated preview plus its footer line
+        self.json_preview.setUndoRedoEnabled(False)
+        self.json_preview.setMaximumBlockCount(self.PREVIEW_MAX_LINES + 1)
         self.json_preview.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
             border: 1px solid #e9ecef;
             border-radius: 6px;
             padding: 8px;
@@ -215,19 +398,14 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout)
 
         # Update preview initially
-        self.update_preview()
+        self._do_update_preview()
 
     def setup_icon(self):
         """Set up the application icon."""
         try:
-            # Try to load the icon from resources
-            icon_path = "src/gui/resources/icons/gnsssignalsimgui.ico"
-            if os.path.exists(icon_path):
-                icon = QIcon(icon_path)
+            icon = _get_app_icon()
+            if not icon.isNull():
                 self.setWindowIcon(icon)
-                info(f"Application icon loaded from {icon_path}")
-            else:
-                debug(f"Icon file not found at {icon_path}")
         except Exception as e:
             debug(f"Failed to load application icon: {e}")
 
@@ -336,8 +514,8 @@ class MainWindow(QMainWindow):
 
     def connect_signals(self):
         """Connect signals between components."""
-        # Connect all created tabs, regardless of whether they're added to the widget
-        tabs_to_connect = [
+        # Connect all created tabs; tabs that were never created are None
+        tabs_to_connect = (
             self.basic_tab,
             self.ephemeris_time_tab,
             self.trajectory_tab,
@@ -345,22 +523,46 @@ class MainWindow(QMainWindow):
             self.power_tab,
             self.output_settings_tab,
             self.generate_tab,
-            self.almanac_tab,  # Connect even if hidden
-        ]
-        
+            self.almanac_tab,
+        )
+
         for tab in tabs_to_connect:
-            if hasattr(tab, "config_changed"):
-                tab.config_changed.connect(self.on_config_changed)
+            config_changed = getattr(tab, "config_changed", None)
+            if config_changed is not None:
+                config_changed.connect(self.on_config_changed)
+
+        # Top-level config fields each tab edits, used to rebuild only those
+        # sections of the preview; other senders invalidate every section
+        self._tab_sections = {
+            self.basic_tab: ("version", "description", "comment"),
+            self.ephemeris_time_tab: ("time", "ephemeris"),
+            self.trajectory_tab: ("trajectory",),
+            self.signal_selection_tab: ("output",),
+            self.power_tab: ("power",),
+            self.output_settings_tab: ("output",),
+            self.generate_tab: ("output",),
+        }
+        if self.almanac_tab is not None:
+            self._tab_sections[self.almanac_tab] = ("almanac",)
+
+        # Ephemeris ranges parsed in the background change validation results
+        self.ephemeris_time_tab.ephemeris_analyzed.connect(self.on_ephemeris_analyzed)
 
         # Connect tab change to refresh current tab
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
 
+        # Connect IFDataGen signals once for all generation runs
+        ifdatagen_integration.progress_updated.connect(self.on_generation_progress)
+        ifdatagen_integration.status_updated.connect(self.on_generation_status)
+        ifdatagen_integration.generation_finished.connect(self.on_generation_finished)
+
     def setup_workflow(self):
         """Set up workflow management and validation callbacks."""
         # Connect workflow manager signals
         self.workflow_manager.step_status_changed.connect(self.on_workflow_step_changed)
         self.workflow_manager.workflow_progress_changed.connect(self.on_workflow_progress_changed)
         self.workflow_manager.tab_state_changed.connect(self.on_tab_state_changed)
+        self.workflow_manager.workflow_changed.connect(self.on_workflow_changed)
         
         # Register validation callbacks for each workflow step
         from core.workflow.manager import register_validation_callback
@@ -388,7 +590,7 @@ class MainWindow(QMainWindow):
         
         # Temporarily disable initial workflow validation to fix tab navigation
         # TODO: Re-enable once workflow logic is properly debugged
-        # self.workflow_manager.validate_all_steps()
+        # self.validate_all()
         
         info("Workflow management setup complete")
 
@@ -400,13 +602,31 @@ class MainWindow(QMainWindow):
         self.smart_workflow.workflow_summary_changed.connect(self.on_workflow_summary_changed)
         
         # Register smart validation callbacks
-        register_smart_validation_callback(WorkflowStep.BASIC_INFO, self.smart_validate_basic_info)
+        # Validators that only read the config are skipped while their section
+        # is unchanged; ephemeris and time checks also depend on files on disk
+        # and tab state, so they always run
+        register_smart_validation_callback(
+            WorkflowStep.BASIC_INFO,
+            self._memoized_validator(self.smart_validate_basic_info, lambda c: (c.version, c.description)),
+        )
         register_smart_validation_callback(WorkflowStep.EPHEMERIS_LOADING, self.smart_validate_ephemeris_loading)
         register_smart_validation_callback(WorkflowStep.TIME_VALIDATION, self.smart_validate_time_configuration)
-        register_smart_validation_callback(WorkflowStep.TRAJECTORY_CONFIG, self.smart_validate_trajectory_configuration)
-        register_smart_validation_callback(WorkflowStep.SIGNAL_SELECTION, self.smart_validate_signal_selection)
-        register_smart_validation_callback(WorkflowStep.POWER_CONFIG, self.smart_validate_power_configuration)
-        register_smart_validation_callback(WorkflowStep.OUTPUT_SETTINGS, self.smart_validate_output_settings)
+        register_smart_validation_callback(
+            WorkflowStep.TRAJECTORY_CONFIG,
+            self._memoized_validator(self.smart_validate_trajectory_configuration, lambda c: c.trajectory),
+        )
+        register_smart_validation_callback(
+            WorkflowStep.SIGNAL_SELECTION,
+            self._memoized_validator(self.smart_validate_signal_selection, lambda c: c.output.system_select),
+        )
+        register_smart_validation_callback(
+            WorkflowStep.POWER_CONFIG,
+            self._memoized_validator(self.smart_validate_power_configuration, lambda c: c.power),
+        )
+        register_smart_validation_callback(
+            WorkflowStep.OUTPUT_SETTINGS,
+            self._memoized_validator(self.smart_validate_output_settings, lambda c: (c.output.name, c.output.type)),
+        )
         
         # Initial smart validation with delay to ensure UI is ready
         from PyQt6.QtCore import QTimer
@@ -414,6 +634,21 @@ class MainWindow(QMainWindow):
         
         info("Smart workflow management setup complete")
 
+    def _memoized_validator(self, validator, section_getter):
+        """Wrap a smart validator so it only runs when its config section changes."""
+        last_key = None
+
+        def run():
+            nonlocal last_key
+            # Dataclass reprs cover every field, so they serve as a section key
+            key = repr(section_getter(self.config))
+            if key == last_key:
+                return
+            last_key = key
+            validator()
+
+        return run
+
     def on_step_feedback_changed(self, step: WorkflowStep, level: ValidationLevel, title: str, message: str):
         """Handle smart workflow step feedback changes."""
         debug(f"Smart workflow feedback: {step.value} -> {level.value}: {title}")
@@ -448,6 +683,19 @@ class MainWindow(QMainWindow):
             else:
                 self.status_label.setText("All workflow steps complete!")
 
+    def on_workflow_changed(self):
+        """Handle a bulk update of all workflow steps."""
+        next_step = self.workflow_manager.get_next_required_step()
+        if next_step is None:
+            self.status_label.setText("All workflow steps complete!")
+            return
+
+        step_status = self.workflow_manager.get_step_status(next_step)
+        if step_status.status in (ValidationStatus.INVALID, ValidationStatus.ERROR):
+            self.status_label.setText(
+                f"Warning: {next_step.value.replace('_', ' ').title()}: {step_status.message}"
+            )
+
     def on_workflow_progress_changed(self, progress: int):
         """Handle overall workflow progress changes."""
         self.progress_bar.setVisible(progress < 100)
@@ -457,24 +705,47 @@ class MainWindow(QMainWindow):
     def on_tab_state_changed(self, tab_name: str, enabled: bool):
         """Handle tab enabled/disabled state changes."""
         debug(f"Received tab state change: '{tab_name}' -> {'enabled' if enabled else 'disabled'}")
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == tab_name:
-                self.tab_widget.setTabEnabled(i, enabled)
-                debug(f"Applied: Tab '{tab_name}' at index {i} {'enabled' if enabled else 'disabled'}")
-                break
+        i = self._tab_index.get(tab_name)
+        if i is not None:
+            self.tab_widget.setTabEnabled(i, enabled)
+            debug(f"Applied: Tab '{tab_name}' at index {i} {'enabled' if enabled else 'disabled'}")
         else:
             debug(f"Warning: Tab '{tab_name}' not found in tab widget")
 
     def on_config_changed(self):
         """Handle configuration changes."""
+        if self._suspend_config_signals:
+            self._suppressed_config_change = True
+            return
+
+        sender = self.sender()
+        if sender is self.ephemeris_time_tab:
+            # Ephemeris files may have been added or removed
+            _list_dir_cached.cache_clear()
+            self._validator_input_hash.clear()
+
+        sections = self._tab_sections.get(sender)
+        if sections is None or "output" in sections:
+            # Signal selection may have changed
+            self.config.output.mark_dirty()
+        if sections is None:
+            self._dirty_sections = None
+        elif self._dirty_sections is not None:
+            self._dirty_sections.update(sections)
+
         self.is_modified = True
+        self._config_version += 1
         self.update_window_title()
         self.update_preview()
         self.config_changed.emit()
         
         # Use smart workflow validation with throttling
-        if hasattr(self, 'smart_workflow'):
-            self.smart_workflow.request_validation(1000)  # 1 second delay
+        self.smart_workflow.request_validation(1000)  # 1 second delay
+
+    def on_ephemeris_analyzed(self):
+        """Revalidate after background parsing without marking the config modified."""
+        self._validator_input_hash.clear()
+        self.smart_workflow.request_validation(0)
 
     def on_tab_changed(self, index):
         """Handle tab change to refresh current tab."""
@@ -488,21 +759,60 @@ class MainWindow(QMainWindow):
 
     def update_window_title(self):
         """Update window title based on current file and modification status."""
-        title = get_app_title()
+        title = self._app_title
         if self.current_file:
-            title += f" - {os.path.basename(self.current_file)}"
+            title += f" - {self._file_basename(self.current_file)}"
         if self.is_modified:
             title += " *"
         self.setWindowTitle(title)
 
+    def _file_basename(self, path: str) -> str:
+        """Return the basename of path, cached per path."""
+        name = self._basename_cache.get(path)
+        if name is None:
+            name = self._basename_cache[path] = os.path.basename(path)
+        return name
+
     def update_preview(self):
+        """Schedule a JSON preview update, coalescing rapid changes."""
+        self._preview_timer.start()
+
+    def _do_update_preview(self):
         """Update the JSON preview."""
+        version = self._config_version
+        if version in (self._preview_version, self._preview_pending_version):
+            return
+
+        # Nothing to see while hidden or minimized; showEvent/changeEvent
+        # schedule a refresh once the preview can be seen again
+        if not self.preview_widget.isVisible() or self.isMinimized():
+            return
+
+        changed = self._dirty_sections
+        if changed is None:
+            changed = self.config.__dataclass_fields__
+
         try:
-            config_dict = self.config.to_dict()
-            json_text = json.dumps(config_dict, indent=2, ensure_ascii=False)
-            self.json_preview.setPlainText(json_text)
+            # Snapshot on the GUI thread, rebuilding only the edited sections;
+            # unchanged sections are shared with the config's cache and are
+            # never modified afterwards
+            config_dict = self.config.to_dict(changed=changed)
+            self._dirty_sections = set()
         except Exception as e:
             self.json_preview.setPlainText(f"Error generating preview: {str(e)}")
+            return
+
+        self._preview_pending_version = version
+        QThreadPool.globalInstance().start(
+            _PreviewTask(self._preview_emitter, version, config_dict, self.PREVIEW_MAX_LINES)
+        )
+
+    def _on_preview_ready(self, version: int, json_text: str):
+        """Show serialized preview text unless a newer config superseded it."""
+        if version != self._config_version:
+            return
+        self.json_preview.setPlainText(json_text)
+        self._preview_version = version
 
     def new_config(self):
         """Create a new configuration."""
@@ -510,8 +820,11 @@ class MainWindow(QMainWindow):
             self.config = GNSSSignalSimConfig()
             self.config.output.system_select = get_default_system_select()
             self.current_file = None
+            self._reset_autosave_state()
             self.is_modified = False
             self.update_window_title()
+            self._config_version += 1
+            self._dirty_sections = None
             self.update_preview()
             self.refresh_tabs()
             self.status_label.setText("New configuration created")
@@ -522,7 +835,7 @@ class MainWindow(QMainWindow):
             return
 
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Load Configuration", get_default_path("config"), "JSON Files (*.json);;All Files (*)"
+            self, "Load Configuration", self._default_config_path, "JSON Files (*.json);;All Files (*)"
         )
 
         if file_path:
@@ -532,12 +845,18 @@ class MainWindow(QMainWindow):
 
                 self.config = GNSSSignalSimConfig.from_dict(data)
                 self.current_file = file_path
+                self._reset_autosave_state()
                 self.is_modified = False
                 self.update_window_title()
+                self._config_version += 1
+                self._dirty_sections = None
+                _list_dir_cached.cache_clear()
+                self._validator_input_hash.clear()
                 self.update_preview()
                 self.refresh_tabs()
-                self.file_label.setText(os.path.basename(file_path))
-                self.status_label.setText(f"Loaded: {os.path.basename(file_path)}")
+                file_name = self._file_basename(file_path)
+                self.file_label.setText(file_name)
+                self.status_label.setText(f"Loaded: {file_name}")
 
             except Exception as e:
                 QMessageBox.critical(
@@ -556,7 +875,7 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Configuration",
-            get_default_path("config") + "/config.json",
+            self._default_config_path + "/config.json",
             "JSON Files (*.json);;All Files (*)",
         )
 
@@ -567,14 +886,23 @@ class MainWindow(QMainWindow):
         """Save configuration to specified file."""
         try:
             config_dict = self.config.to_dict()
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+
+            # QSaveFile writes to a temporary file and renames it on commit,
+            # so a failed save never leaves a truncated config behind
+            save_file = QSaveFile(file_path)
+            if not save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+                raise OSError(save_file.errorString())
+            save_file.write(_dump_json_bytes(config_dict))
+            if not save_file.commit():
+                raise OSError(save_file.errorString())
 
             self.current_file = file_path
+            self._reset_autosave_state()
             self.is_modified = False
             self.update_window_title()
-            self.file_label.setText(os.path.basename(file_path))
-            self.status_label.setText(f"Saved: {os.path.basename(file_path)}")
+            file_name = self._file_basename(file_path)
+            self.file_label.setText(file_name)
+            self.status_label.setText(f"Saved: {file_name}")
 
         except Exception as e:
             QMessageBox.critical(
@@ -582,14 +910,49 @@ class MainWindow(QMainWindow):
             )
 
     def auto_save(self):
-        """Auto-save configuration if modified."""
-        if self.is_modified and self.current_file:
-            try:
-                backup_path = self.current_file + ".backup"
-                self.save_to_file(backup_path)
-            except Exception as e:
-                debug(f"Auto-save failed: {e}")  # Log the error for debugging
-                pass  # Ignore auto-save errors
+        """Auto-save configuration to a backup file if modified."""
+        if not (self.is_modified and self.current_file):
+            return
+
+        # Nothing changed since the last auto-save
+        if self._autosaved_version == self._config_version:
+            return
+
+        version = self._config_version
+        temp_path = None
+        try:
+            data = _dump_json_bytes(self.config.to_dict())
+
+            # Same bytes as the existing backup
+            digest = hashlib.sha1(data).digest()
+            if digest == self._autosaved_digest:
+                self._autosaved_version = version
+                return
+
+            backup_path = self.current_file + ".backup"
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(os.path.abspath(backup_path)), suffix=".tmp", delete=False
+            ) as f:
+                temp_path = f.name
+                f.write(data)
+            os.replace(temp_path, backup_path)
+            temp_path = None
+            # Only a written backup counts as saved, so failures retry next tick
+            self._autosaved_version = version
+            self._autosaved_digest = digest
+            debug(f"Auto-saved backup: {backup_path}")
+        except Exception as e:
+            debug(f"Auto-save failed: {e}")  # Log the error for debugging
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def _reset_autosave_state(self):
+        """Forget the last backup; call whenever current_file changes."""
+        self._autosaved_version = -1
+        self._autosaved_digest = None
 
     def validate_config(self):
         """Validate current configuration."""
@@ -614,7 +977,7 @@ class MainWindow(QMainWindow):
                 file_path, _ = QFileDialog.getOpenFileName(
                     self,
                     "Locate IFDataGen.exe",
-                    get_default_path("config"),
+                    self._default_config_path,
                     "Executable Files (*.exe);;All Files (*)",
                 )
                 if file_path:
@@ -643,11 +1006,6 @@ class MainWindow(QMainWindow):
             else:
                 return
 
-        # Connect IFDataGen signals
-        ifdatagen_integration.progress_updated.connect(self.on_generation_progress)
-        ifdatagen_integration.status_updated.connect(self.on_generation_status)
-        ifdatagen_integration.generation_finished.connect(self.on_generation_finished)
-
         # Start signal generation
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
@@ -693,27 +1051,25 @@ class MainWindow(QMainWindow):
             )
             error(f"Signal generation failed: {message}")
 
-        # Disconnect signals to prevent memory leaks
-        try:
-            ifdatagen_integration.progress_updated.disconnect(
-                self.on_generation_progress
-            )
-            ifdatagen_integration.status_updated.disconnect(self.on_generation_status)
-            ifdatagen_integration.generation_finished.disconnect(
-                self.on_generation_finished
-            )
-        except:
-            pass  # Ignore disconnect errors
-
     def refresh_tabs(self):
         """Refresh all tabs with current configuration."""
         debug("Refreshing all tabs with current configuration")
-        for i in range(self.tab_widget.count()):
-            tab = self.tab_widget.widget(i)
-            if hasattr(tab, "refresh_from_config"):
-                tab_name = self.tab_widget.tabText(i)
-                debug(f"Refreshing tab: {tab_name}")
-                tab.refresh_from_config()
+        self._suspend_config_signals = True
+        self._suppressed_config_change = False
+        try:
+            for i in range(self.tab_widget.count()):
+                tab = self.tab_widget.widget(i)
+                if hasattr(tab, "refresh_from_config"):
+                    tab_name = self.tab_widget.tabText(i)
+                    debug(f"Refreshing tab: {tab_name}")
+                    tab.refresh_from_config()
+        finally:
+            self._suspend_config_signals = False
+
+        # Handle any changes the tabs made while refreshing in a single pass
+        if self._suppressed_config_change:
+            self._suppressed_config_change = False
+            self.on_config_changed()
 
     def check_save_changes(self) -> bool:
         """Check if changes need to be saved. Returns True if it's safe to continue."""
@@ -737,12 +1093,48 @@ class MainWindow(QMainWindow):
         else:  # Cancel
             return False
 
+    def check_save_changes_async(self, on_done):
+        """Ask about unsaved changes without a nested event loop.
+
+        on_done(bool) is called with True once it is safe to continue.
+        """
+        if not self.is_modified:
+            on_done(True)
+            return
+
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Unsaved Changes",
+            "You have unsaved changes. Do you want to save them?",
+            QMessageBox.StandardButton.Save
+            | QMessageBox.StandardButton.Discard
+            | QMessageBox.StandardButton.Cancel,
+            self,
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def on_button_clicked(button):
+            reply = box.standardButton(button)
+            if reply == QMessageBox.StandardButton.Save:
+                self.save_config()
+                on_done(not self.is_modified)  # True if save was successful
+            else:
+                on_done(reply == QMessageBox.StandardButton.Discard)
+
+        box.buttonClicked.connect(on_button_clicked)
+        box.open()
+
     def show_preferences(self):
         """Show preferences dialog."""
         log_button_click("Show Preferences")
         
-        dialog = PreferencesDialog(self)
-        dialog.preferences_changed.connect(self.on_preferences_changed)
+        if self._prefs_dialog is None:
+            self._prefs_dialog = PreferencesDialog(self)
+            self._prefs_dialog.preferences_changed.connect(self.on_preferences_changed)
+        else:
+            # Discard edits left over from a cancelled session
+            self._prefs_dialog.load_preferences()
+        dialog = self._prefs_dialog
         
         if dialog.exec() == PreferencesDialog.DialogCode.Accepted:
             info("Preferences dialog accepted")
@@ -754,28 +1146,38 @@ class MainWindow(QMainWindow):
         """Show about dialog."""
         log_button_click("Show About")
         
-        dialog = AboutDialog(self)
-        dialog.exec()
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec()
         
         info("About dialog shown")
 
     def apply_settings(self):
         """Apply current settings to the application."""
+        # Resolve the config directory once per settings change, not per dialog
+        self._default_config_path = get_default_path("config")
+
+        general = self.settings_manager.get_section("general")
+        appearance = self.settings_manager.get_section("appearance")
+
         # Apply auto-save settings
-        auto_save_enabled = self.settings_manager.get("general", "auto_save_enabled", True)
-        if auto_save_enabled:
-            auto_save_interval = self.settings_manager.get("general", "auto_save_interval", 5) * 60 * 1000
+        if general.get("auto_save_enabled", True):
+            auto_save_interval = general.get("auto_save_interval", 5) * 60 * 1000
             self.auto_save_timer.start(auto_save_interval)
         else:
             self.auto_save_timer.stop()
         
         # Apply appearance settings
-        font_family = self.settings_manager.get("appearance", "font_family", "System Default")
-        font_size = self.settings_manager.get("appearance", "font_size", 10)
+        font_family = appearance.get("font_family", "System Default")
+        font_size = appearance.get("font_size", 10)
         
+        # setFont propagates through the whole widget tree, so skip it when
+        # the preferred font has not changed since the last apply
         if font_family != "System Default":
-            font = QFont(font_family, font_size)
-            self.setFont(font)
+            new_font = (font_family, font_size)
+            if new_font != self._applied_font:
+                self.setFont(QFont(font_family, font_size))
+                self._applied_font = new_font
         
         # Apply logging settings
         self.apply_logging_settings()
@@ -783,16 +1185,19 @@ class MainWindow(QMainWindow):
         info("Application settings applied")
     
     def apply_logging_settings(self):
-        """Apply logging settings to the logger."""
-        configure_logging_from_settings(self.settings_manager)
+        """Apply logging settings to the logger, skipping unchanged settings."""
+        if get_logging_fingerprint(self.settings_manager) == self._last_log_fingerprint:
+            return
+        self._last_log_fingerprint = configure_logging_from_settings(self.settings_manager)
 
     def on_preferences_changed(self):
         """Handle preferences changes."""
         info("Preferences have been changed")
-        
-        # Reapply all settings
+        self._prefs_apply_timer.start()
+
+    def _apply_changed_preferences(self):
+        """Reapply all settings after a burst of preference changes."""
         self.apply_settings()
-        
         self.status_label.setText("Preferences applied")
 
     def save_config_with_logging(self):
@@ -818,38 +1223,48 @@ class MainWindow(QMainWindow):
         """Load a configuration template."""
         log_button_click("Load Template")
 
-        dialog = TemplateDialog(self, self.config)
-        dialog.template_selected.connect(self.apply_template)
-        dialog.exec()
+        self._get_template_dialog().exec()
 
     def save_as_template(self):
         """Save current configuration as a template."""
         log_button_click("Save as Template")
 
-        dialog = TemplateDialog(self, self.config)
-        dialog.exec()
+        self._get_template_dialog().exec()
 
     def manage_templates(self):
         """Open template management dialog."""
         log_button_click("Manage Templates")
 
-        dialog = TemplateDialog(self, self.config)
-        dialog.exec()
+        self._get_template_dialog().exec()
+
+    def _get_template_dialog(self):
+        """Return the shared template dialog, bound to the current config."""
+        if self._template_dialog is None:
+            self._template_dialog = TemplateDialog(self, self.config)
+            self._template_dialog.template_selected.connect(self.apply_template)
+        else:
+            self._template_dialog.set_config(self.config)
+        return self._template_dialog
 
     def apply_template(self, template_config):
         """Apply a template configuration."""
         if self.check_save_changes():
             self.config = template_config
             self.current_file = None
+            self._reset_autosave_state()
             self.is_modified = True
 
-            # Refresh all tabs
-            for i in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(i)
-                if hasattr(tab, "refresh_from_config"):
-                    tab.refresh_from_config()
+            # Refresh only the visible tab; on_tab_changed refreshes every
+            # other tab when the user switches to it
+            tab = self.tab_widget.currentWidget()
+            if hasattr(tab, "refresh_from_config"):
+                tab.refresh_from_config()
 
             self.update_window_title()
+            self._config_version += 1
+            self._dirty_sections = None
+            _list_dir_cached.cache_clear()
+            self._validator_input_hash.clear()
             self.update_preview()
             self.file_label.setText("Template loaded")
 
@@ -860,231 +1275,224 @@ class MainWindow(QMainWindow):
                 "Template configuration has been applied successfully.",
             )
 
+    def showEvent(self, event):
+        """Refresh a preview that went stale while the window was hidden."""
+        super().showEvent(event)
+        self.update_preview()
+
+    def changeEvent(self, event):
+        """Refresh a preview that went stale while the window was minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self.update_preview()
+
     def closeEvent(self, event):
         """Handle application close event."""
         info("Application closing")
-        if self.check_save_changes():
-            # Clean up temporary files before closing
-            try:
-                ifdatagen_integration.cleanup_temp_files()
-            except Exception as e:
-                debug(f"Error during cleanup: {e}")
-            
-            info("Application closed successfully")
-            event.accept()
+        if self.is_modified and not self._close_confirmed:
+            # Ask without blocking; _finish_close closes again if allowed
+            event.ignore()
+            if not self._close_prompt_open:
+                self._close_prompt_open = True
+                self.check_save_changes_async(self._finish_close)
+            return
+
+        # Clean up temporary files before closing
+        try:
+            ifdatagen_integration.cleanup_temp_files()
+        except Exception as e:
+            debug(f"Error during cleanup: {e}")
+        
+        info("Application closed successfully")
+        event.accept()
+
+    def _finish_close(self, ok: bool):
+        """Complete a close that was waiting on the unsaved-changes prompt."""
+        self._close_prompt_open = False
+        if ok:
+            self._close_confirmed = True
+            self.close()
         else:
             info("Application close cancelled by user")
-            event.ignore()
 
     # Validation methods for each workflow step
-    def validate_basic_info(self):
-        """Validate basic information step."""
+    def validate_all(self):
+        """Validate every workflow step in one pass and publish the results together."""
+        results = [
+            self._run_check(step, check, label, fingerprint)
+            for step, check, label, fingerprint in self._workflow_checks()
+        ]
+        self.workflow_manager.update_steps_bulk(results)
+
+    def _workflow_checks(self):
+        """Return (step, check, error label, input fingerprint) for each step, in order.
+
+        A fingerprint of None means the step depends on state outside the
+        config and is always re-checked.
+        """
+        config = self.config
+        return (
+            (WorkflowStep.BASIC_INFO, self._check_basic_info, "basic info",
+             lambda: config is not None),
+            (WorkflowStep.EPHEMERIS_LOADING, self._check_ephemeris_loading, "ephemeris",
+             # Files can appear or vanish on disk; expire with the listing cache
+             lambda: (tuple(eph.name for eph in config.ephemeris), int(time.monotonic()) // 2)),
+            (WorkflowStep.TIME_VALIDATION, self._check_time_configuration, "time",
+             None),
+            (WorkflowStep.TRAJECTORY_CONFIG, self._check_trajectory_configuration, "trajectory",
+             lambda: len(config.trajectory.trajectory_list)),
+            (WorkflowStep.SIGNAL_SELECTION, self._check_signal_selection, "signal selection",
+             lambda: (len(config.output.system_select), len(config.output.enabled_signals))),
+            (WorkflowStep.POWER_CONFIG, self._check_power_configuration, "power config",
+             lambda: config.power is not None),
+            (WorkflowStep.OUTPUT_SETTINGS, self._check_output_settings, "output settings",
+             lambda: config.output.name),
+        )
+
+    def _run_check(self, step, check, label, fingerprint=None):
+        """Run one step check, turning exceptions into an ERROR result.
+
+        Results are reused while the step's input fingerprint is unchanged.
+        """
+        key = None
+        if fingerprint is not None:
+            try:
+                key = fingerprint()
+            except Exception:
+                key = None
+            cached = self._validator_input_hash.get(step)
+            if key is not None and cached is not None and cached[0] == key:
+                return cached[1]
+
         try:
-            # Basic info is always valid if we have a config
-            if self.config:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.BASIC_INFO,
-                    ValidationStatus.VALID,
-                    "Basic information configured",
-                    completion_percentage=100
-                )
-            else:
+            status, message, completion = check()
+        except Exception as e:
+            status, message, completion = ValidationStatus.ERROR, f"Error validating {label}: {str(e)}", 0
+            key = None  # Never reuse an error result
+
+        result = (step, status, message, completion)
+        if key is not None:
+            self._validator_input_hash[step] = (key, result)
+        else:
+            self._validator_input_hash.pop(step, None)
+        return result
+
+    def _validate_step(self, step):
+        """Validate a single workflow step and publish its result."""
+        for check_step, check, label, fingerprint in self._workflow_checks():
+            if check_step == step:
+                _, status, message, completion = self._run_check(step, check, label, fingerprint)
                 self.workflow_manager.update_step_status(
-                    WorkflowStep.BASIC_INFO,
-                    ValidationStatus.INVALID,
-                    "No configuration available"
+                    step, status, message, completion_percentage=completion
                 )
-        except Exception as e:
-            self.workflow_manager.update_step_status(
-                WorkflowStep.BASIC_INFO,
-                ValidationStatus.ERROR,
-                f"Error validating basic info: {str(e)}"
-            )
+                return
+
+    def validate_basic_info(self):
+        """Validate basic information step."""
+        self._validate_step(WorkflowStep.BASIC_INFO)
 
     def validate_ephemeris_loading(self):
         """Validate ephemeris loading step."""
-        try:
-            if self.config.ephemeris and len(self.config.ephemeris) > 0:
-                # Check if files exist and are valid
-                valid_files = 0
-                total_files = len(self.config.ephemeris)
-                
-                for eph_config in self.config.ephemeris:
-                    if os.path.exists(eph_config.name):
-                        valid_files += 1
-                
-                if valid_files > 0:
-                    completion = int((valid_files / total_files) * 100)
-                    self.workflow_manager.update_step_status(
-                        WorkflowStep.EPHEMERIS_LOADING,
-                        ValidationStatus.VALID,
-                        f"{valid_files}/{total_files} ephemeris files loaded",
-                        completion_percentage=completion
-                    )
-                else:
-                    self.workflow_manager.update_step_status(
-                        WorkflowStep.EPHEMERIS_LOADING,
-                        ValidationStatus.INVALID,
-                        "No valid ephemeris files found"
-                    )
-            else:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.EPHEMERIS_LOADING,
-                    ValidationStatus.INVALID,
-                    "No ephemeris files loaded"
-                )
-        except Exception as e:
-            self.workflow_manager.update_step_status(
-                WorkflowStep.EPHEMERIS_LOADING,
-                ValidationStatus.ERROR,
-                f"Error validating ephemeris: {str(e)}"
-            )
+        self._validate_step(WorkflowStep.EPHEMERIS_LOADING)
 
     def validate_time_configuration(self):
         """Validate time configuration step."""
-        try:
-            # Delegate to ephemeris_time_tab for detailed validation
-            if hasattr(self.ephemeris_time_tab, 'ephemeris_file_ranges') and self.ephemeris_time_tab.ephemeris_file_ranges:
-                # Check if current time is within validity range
-                self.ephemeris_time_tab.validate_current_time()
-                
-                # Check the validation result from the tab
-                status_text = self.ephemeris_time_tab.time_status_label.text()
-                if "VALID" in status_text:
-                    self.workflow_manager.update_step_status(
-                        WorkflowStep.TIME_VALIDATION,
-                        ValidationStatus.VALID,
-                        "Time is within ephemeris validity range",
-                        completion_percentage=100
-                    )
-                else:
-                    self.workflow_manager.update_step_status(
-                        WorkflowStep.TIME_VALIDATION,
-                        ValidationStatus.INVALID,
-                        "Time is outside ephemeris validity range"
-                    )
-            else:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.TIME_VALIDATION,
-                    ValidationStatus.INVALID,
-                    "No ephemeris validity range available"
-                )
-        except Exception as e:
-            self.workflow_manager.update_step_status(
-                WorkflowStep.TIME_VALIDATION,
-                ValidationStatus.ERROR,
-                f"Error validating time: {str(e)}"
-            )
+        self._validate_step(WorkflowStep.TIME_VALIDATION)
 
     def validate_trajectory_configuration(self):
         """Validate trajectory configuration step."""
-        try:
-            # Check if trajectory is configured
-            if hasattr(self.config.trajectory, 'trajectory_list') and self.config.trajectory.trajectory_list:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.TRAJECTORY_CONFIG,
-                    ValidationStatus.VALID,
-                    f"{len(self.config.trajectory.trajectory_list)} trajectory segments configured",
-                    completion_percentage=100
-                )
-            else:
-                # Static trajectory is also valid
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.TRAJECTORY_CONFIG,
-                    ValidationStatus.VALID,
-                    "Static trajectory configured",
-                    completion_percentage=100
-                )
-        except Exception as e:
-            self.workflow_manager.update_step_status(
-                WorkflowStep.TRAJECTORY_CONFIG,
-                ValidationStatus.ERROR,
-                f"Error validating trajectory: {str(e)}"
-            )
+        self._validate_step(WorkflowStep.TRAJECTORY_CONFIG)
 
     def validate_signal_selection(self):
         """Validate signal selection step."""
-        try:
-            if self.config.output.system_select:
-                enabled_signals = [s for s in self.config.output.system_select if s.enable]
-                if enabled_signals:
-                    self.workflow_manager.update_step_status(
-                        WorkflowStep.SIGNAL_SELECTION,
-                        ValidationStatus.VALID,
-                        f"{len(enabled_signals)} signals selected",
-                        completion_percentage=100
-                    )
-                else:
-                    self.workflow_manager.update_step_status(
-                        WorkflowStep.SIGNAL_SELECTION,
-                        ValidationStatus.INVALID,
-                        "No signals selected"
-                    )
-            else:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.SIGNAL_SELECTION,
-                    ValidationStatus.INVALID,
-                    "Signal selection not configured"
-                )
-        except Exception as e:
-            self.workflow_manager.update_step_status(
-                WorkflowStep.SIGNAL_SELECTION,
-                ValidationStatus.ERROR,
-                f"Error validating signal selection: {str(e)}"
-            )
+        self._validate_step(WorkflowStep.SIGNAL_SELECTION)
 
     def validate_power_configuration(self):
         """Validate power configuration step."""
-        try:
-            if self.config.power:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.POWER_CONFIG,
-                    ValidationStatus.VALID,
-                    "Power configuration set",
-                    completion_percentage=100
-                )
-            else:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.POWER_CONFIG,
-                    ValidationStatus.INVALID,
-                    "Power configuration missing"
-                )
-        except Exception as e:
-            self.workflow_manager.update_step_status(
-                WorkflowStep.POWER_CONFIG,
-                ValidationStatus.ERROR,
-                f"Error validating power config: {str(e)}"
-            )
+        self._validate_step(WorkflowStep.POWER_CONFIG)
 
     def validate_output_settings(self):
         """Validate output settings step."""
-        try:
-            if self.config.output and self.config.output.name:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.OUTPUT_SETTINGS,
-                    ValidationStatus.VALID,
-                    "Output settings configured",
-                    completion_percentage=100
-                )
-            else:
-                self.workflow_manager.update_step_status(
-                    WorkflowStep.OUTPUT_SETTINGS,
-                    ValidationStatus.INVALID,
-                    "Output file not specified"
-                )
-        except Exception as e:
-            self.workflow_manager.update_step_status(
-                WorkflowStep.OUTPUT_SETTINGS,
-                ValidationStatus.ERROR,
-                f"Error validating output settings: {str(e)}"
-            )
+        self._validate_step(WorkflowStep.OUTPUT_SETTINGS)
+
+    def _check_basic_info(self):
+        """Check basic information; returns (status, message, completion)."""
+        # Basic info is always valid if we have a config
+        if self.config:
+            return ValidationStatus.VALID, "Basic information configured", 100
+        return ValidationStatus.INVALID, "No configuration available", 0
+
+    def _check_ephemeris_loading(self):
+        """Check ephemeris loading; returns (status, message, completion)."""
+        ephemeris = self.config.ephemeris
+        if not ephemeris:
+            return ValidationStatus.INVALID, "No ephemeris files loaded", 0
+
+        # Check if files exist and are valid
+        total_files = len(ephemeris)
+        present = _bulk_exists([eph.name for eph in ephemeris])
+        valid_files = sum(1 for eph_config in ephemeris if present[eph_config.name])
+
+        if valid_files > 0:
+            completion = int((valid_files / total_files) * 100)
+            return ValidationStatus.VALID, f"{valid_files}/{total_files} ephemeris files loaded", completion
+        return ValidationStatus.INVALID, "No valid ephemeris files found", 0
+
+    def _check_time_configuration(self):
+        """Check time configuration; returns (status, message, completion)."""
+        # Delegate to ephemeris_time_tab for detailed validation
+        if not self.ephemeris_time_tab.ephemeris_file_ranges:
+            return ValidationStatus.INVALID, "No ephemeris validity range available", 0
+
+        # Check if current time is within validity range
+        self.ephemeris_time_tab.validate_current_time()
+
+        # Check the validation result from the tab
+        if self.ephemeris_time_tab.last_time_validation == ValidationStatus.VALID:
+            return ValidationStatus.VALID, "Time is within ephemeris validity range", 100
+        if (
+            self.ephemeris_time_tab.last_time_validation is None
+            and self.ephemeris_time_tab.has_pending_included_files()
+        ):
+            return ValidationStatus.IN_PROGRESS, "Ephemeris files are still being analyzed", 25
+        return ValidationStatus.INVALID, "Time is outside ephemeris validity range", 0
+
+    def _check_trajectory_configuration(self):
+        """Check trajectory configuration; returns (status, message, completion)."""
+        trajectory_list = self.config.trajectory.trajectory_list
+        if trajectory_list:
+            return ValidationStatus.VALID, f"{len(trajectory_list)} trajectory segments configured", 100
+        # Static trajectory is also valid
+        return ValidationStatus.VALID, "Static trajectory configured", 100
+
+    def _check_signal_selection(self):
+        """Check signal selection; returns (status, message, completion)."""
+        system_select = self.config.output.system_select
+        if not system_select:
+            return ValidationStatus.INVALID, "Signal selection not configured", 0
+
+        enabled_count = len(self.config.output.enabled_signals)
+        if enabled_count:
+            return ValidationStatus.VALID, f"{enabled_count} signals selected", 100
+        return ValidationStatus.INVALID, "No signals selected", 0
+
+    def _check_power_configuration(self):
+        """Check power configuration; returns (status, message, completion)."""
+        if self.config.power:
+            return ValidationStatus.VALID, "Power configuration set", 100
+        return ValidationStatus.INVALID, "Power configuration missing", 0
+
+    def _check_output_settings(self):
+        """Check output settings; returns (status, message, completion)."""
+        output = self.config.output
+        if output and output.name:
+            return ValidationStatus.VALID, "Output settings configured", 100
+        return ValidationStatus.INVALID, "Output file not specified", 0
 
     # Smart validation methods for better user guidance
     def smart_validate_basic_info(self):
         """Smart validation for basic information step."""
         try:
-            from ..core.workflow.smart_workflow import update_step_feedback
-            
             if self.config:
                 # Check if basic info is filled
                 has_description = bool(self.config.description and self.config.description.strip())
@@ -1121,14 +1529,13 @@ class MainWindow(QMainWindow):
     def smart_validate_ephemeris_loading(self):
         """Smart validation for ephemeris loading step."""
         try:
-            from core.workflow.smart_workflow import update_step_feedback
-            
             if self.config.ephemeris and len(self.config.ephemeris) > 0:
                 valid_files = 0
                 total_files = len(self.config.ephemeris)
                 
+                present = _bulk_exists([eph.name for eph in self.config.ephemeris])
                 for eph_config in self.config.ephemeris:
-                    if os.path.exists(eph_config.name):
+                    if present[eph_config.name]:
                         valid_files += 1
                 
                 if valid_files == total_files:
@@ -1173,15 +1580,13 @@ class MainWindow(QMainWindow):
     def smart_validate_time_configuration(self):
         """Smart validation for time configuration step."""
         try:
-            from ..core.workflow.smart_workflow import update_step_feedback
-            
-            if hasattr(self.ephemeris_time_tab, 'ephemeris_file_ranges') and self.ephemeris_time_tab.ephemeris_file_ranges:
+            if self.ephemeris_time_tab.ephemeris_file_ranges:
                 # Trigger time validation in the tab
                 self.ephemeris_time_tab.validate_current_time()
                 
                 # Check the validation result
-                status_text = self.ephemeris_time_tab.time_status_label.text()
-                if "VALID" in status_text:
+                time_status = self.ephemeris_time_tab.last_time_validation
+                if time_status == ValidationStatus.VALID:
                     update_step_feedback(
                         WorkflowStep.TIME_VALIDATION,
                         ValidationLevel.SUCCESS,
@@ -1190,7 +1595,7 @@ class MainWindow(QMainWindow):
                         "Ready to configure trajectory",
                         completion_percentage=100
                     )
-                elif "INVALID" in status_text:
+                elif time_status == ValidationStatus.INVALID:
                     update_step_feedback(
                         WorkflowStep.TIME_VALIDATION,
                         ValidationLevel.ERROR,
@@ -1223,9 +1628,7 @@ class MainWindow(QMainWindow):
     def smart_validate_trajectory_configuration(self):
         """Smart validation for trajectory configuration step."""
         try:
-            from ..core.workflow.smart_workflow import update_step_feedback
-            
-            if hasattr(self.config.trajectory, 'trajectory_list') and self.config.trajectory.trajectory_list:
+            if self.config.trajectory.trajectory_list:
                 segment_count = len(self.config.trajectory.trajectory_list)
                 update_step_feedback(
                     WorkflowStep.TRAJECTORY_CONFIG,
@@ -1237,8 +1640,7 @@ class MainWindow(QMainWindow):
                 )
             else:
                 # Check if we have initial position configured
-                if (hasattr(self.config.trajectory, 'init_position') and 
-                    self.config.trajectory.init_position):
+                if self.config.trajectory.init_position:
                     update_step_feedback(
                         WorkflowStep.TRAJECTORY_CONFIG,
                         ValidationLevel.SUCCESS,
@@ -1262,16 +1664,13 @@ class MainWindow(QMainWindow):
     def smart_validate_signal_selection(self):
         """Smart validation for signal selection step."""
         try:
-            from ..core.workflow.smart_workflow import update_step_feedback
-            
             if self.config.output.system_select:
-                enabled_signals = [s for s in self.config.output.system_select if s.enable]
+                enabled_signals = self.config.output.enabled_signals
                 total_signals = len(self.config.output.system_select)
                 
                 if enabled_signals:
                     # Group by constellation
-                    constellations = set(s.system for s in enabled_signals)
-                    constellation_names = [c.value for c in constellations]
+                    constellation_names = [c.value for c in self.config.output.enabled_constellations]
                     
                     update_step_feedback(
                         WorkflowStep.SIGNAL_SELECTION,
@@ -1305,11 +1704,9 @@ class MainWindow(QMainWindow):
     def smart_validate_power_configuration(self):
         """Smart validation for power configuration step."""
         try:
-            from ..core.workflow.smart_workflow import update_step_feedback
-            
             if self.config.power:
-                has_noise_floor = hasattr(self.config.power, 'noise_floor') and self.config.power.noise_floor is not None
-                has_init_power = hasattr(self.config.power, 'init_power') and self.config.power.init_power is not None
+                has_noise_floor = self.config.power.noise_floor is not None
+                has_init_power = self.config.power.init_power is not None
                 
                 if has_noise_floor and has_init_power:
                     update_step_feedback(
@@ -1344,17 +1741,15 @@ class MainWindow(QMainWindow):
     def smart_validate_output_settings(self):
         """Smart validation for output settings step."""
         try:
-            from ..core.workflow.smart_workflow import update_step_feedback
-            
             if self.config.output and self.config.output.name:
                 output_name = self.config.output.name
-                output_type = getattr(self.config.output, 'type', 'Unknown')
+                output_type = self.config.output.type
                 
                 update_step_feedback(
                     WorkflowStep.OUTPUT_SETTINGS,
                     ValidationLevel.SUCCESS,
                     "Output Configuration Complete",
-                    f"Output: {os.path.basename(output_name)} ({output_type})",
+                    f"Output: {self._file_basename(output_name)} ({output_type})",
                     "Configuration is ready for signal generation!",
                     completion_percentage=100
                 )
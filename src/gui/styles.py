@@ -0,0 +1,124 @@
+"""
+Shared Stylesheets for GNSSSignalSim GUI
+
+Author: Muhammad Qaisar Ali
+GitHub: https://github.com/MuhammadQaisarAli
+
+Widgets opt in to these rules by object name. APP_STYLESHEET is installed
+once on the QApplication, so Qt parses it a single time instead of once per
+tab construction.
+"""
+
+
+def _group_box_qss(
+    object_name: str, color: str, spacing: int = 10, color_title: bool = True
+) -> str:
+    """Return the accented group box rules for the named QGroupBox."""
+    title_color = f"\n    color: {color};" if color_title else ""
+    return f"""
+QGroupBox#{object_name} {{
+    font-weight: bold;
+    font-size: 12px;
+    border: 2px solid {color};
+    border-radius: 8px;
+    margin-top: {spacing}px;
+    padding-top: {spacing}px;
+}}
+QGroupBox#{object_name}::title {{
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;{title_color}
+}}
+"""
+
+
+# Object names used by the tabs
+BASIC_GROUP = "basicGroup"
+SUMMARY_GROUP = "summaryGroup"
+SUMMARY_LABEL = "summaryLabel"
+ALMANAC_GROUP = "almanacGroup"
+EPHEMERIS_GROUP = "ephemerisGroup"
+TIME_VALIDATION_GROUP = "timeValidationGroup"
+EPHEMERIS_LIST = "ephemerisList"
+EPHEMERIS_TABLE = "ephemerisTable"
+
+SUMMARY_LABEL_QSS = f"""
+QLabel#{SUMMARY_LABEL} {{
+    background-color: #343a40;
+    padding: 15px;
+    border: 1px solid #dee2e6;
+    border-radius: 6px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 11px;
+    line-height: 1.4;
+}}
+"""
+
+EPHEMERIS_LIST_QSS = f"""
+QListView#{EPHEMERIS_LIST} {{
+    background-color: #343a40;
+    color: #f8f9fa;
+    border: 1px solid #495057;
+    border-radius: 4px;
+}}
+QListView#{EPHEMERIS_LIST}::item {{
+    padding: 5px;
+}}
+QListView#{EPHEMERIS_LIST}::item:selected {{
+    background-color: #0078d4; /* Blue color for selected item */
+    color: #ffffff;
+}}
+"""
+
+EPHEMERIS_TABLE_QSS = f"""
+QTableView#{EPHEMERIS_TABLE} {{
+    background-color: #343a40;
+    alternate-background-color: #3E444A;
+    gridline-color: #495057;
+    color: #f8f9fa;
+    font-family: 'Segoe UI', 'Consolas', 'Monaco', monospace;
+    font-size: 10px;
+}}
+QTableView#{EPHEMERIS_TABLE}::item {{
+    padding: 8px;
+    border-bottom: 1px solid #495057;
+}}
+QTableView#{EPHEMERIS_TABLE}::item:selected {{
+    background-color: #0078d4;
+    color: #ffffff;
+}}
+QTableView#{EPHEMERIS_TABLE}::item:hover {{
+    background-color: #454a4f;
+}}
+QTableView#{EPHEMERIS_TABLE} QHeaderView::section {{
+    background-color: #2c3136;
+    color: #f8f9fa;
+    padding: 8px;
+    border: 1px solid #495057;
+    font-weight: bold;
+    font-size: 10px;
+}}
+QTableView#{EPHEMERIS_TABLE} QHeaderView::section:horizontal:last-child {{
+    border-right: none;
+}}
+QTableView#{EPHEMERIS_TABLE} QHeaderView::section:vertical:last-child {{
+    border-bottom: none;
+}}
+QTableView#{EPHEMERIS_TABLE} QTableCornerButton::section {{
+    background-color: #2c3136;
+    border: 1px solid #495057;
+}}
+"""
+
+APP_STYLESHEET = "".join(
+    (
+        _group_box_qss(BASIC_GROUP, "#007acc"),
+        _group_box_qss(SUMMARY_GROUP, "#28a745"),
+        SUMMARY_LABEL_QSS,
+        _group_box_qss(ALMANAC_GROUP, "#20c997"),
+        _group_box_qss(EPHEMERIS_GROUP, "#007acc", color_title=False),
+        _group_box_qss(TIME_VALIDATION_GROUP, "#28a745", spacing=5, color_title=False),
+        EPHEMERIS_LIST_QSS,
+        EPHEMERIS_TABLE_QSS,
+    )
+)
@@ -5,20 +5,148 @@ Author: Muhammad Qaisar Ali
 GitHub: https://github.com/MuhammadQaisarAli
 """
 
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QGroupBox,
     QGridLayout,
-    QLineEdit,
     QPushButton,
     QComboBox,
-    QTableWidget,
+    QTableView,
     QHeaderView,
+    QStyledItemDelegate,
+    QFileDialog,
+)
+from PyQt6.QtCore import (
+    pyqtSignal,
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QStringListModel,
 )
-from PyQt6.QtCore import pyqtSignal
 
+from gui.styles import ALMANAC_GROUP
 from core.config.models import GNSSSignalSimConfig, AlmanacConfig, ConstellationType
+from core.utils.settings import get_default_path
+
+_CONSTELLATION_VALUES = tuple(c.value for c in ConstellationType)
+_CONSTELLATION_BY_VALUE = {c.value: c for c in ConstellationType}
+
+_constellation_model = None  # Shared item model for every system editor
+
+
+def _get_constellation_model() -> QStringListModel:
+    """Return the constellation list model, creating it on first use."""
+    global _constellation_model
+    if _constellation_model is None:
+        _constellation_model = QStringListModel(list(_CONSTELLATION_VALUES))
+    return _constellation_model
+
+
+class AlmanacModel(QAbstractTableModel):
+    """Table model that views and edits a config's almanac list in place."""
+
+    HEADERS = ("System", "File Path")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._data)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.EditRole,
+        ):
+            return None
+        entry = self._data[index.row()]
+        if index.column() == 0:
+            return entry.system.value
+        return entry.name
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        entry = self._data[index.row()]
+        if index.column() == 0:
+            system = _CONSTELLATION_BY_VALUE[value]
+            if system == entry.system:
+                return False
+            entry.system = system
+        else:
+            name = str(value)
+            if name == entry.name:
+                return False
+            entry.name = name
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        if count <= 0 or parent.isValid():
+            return False
+        default_system = _CONSTELLATION_BY_VALUE[_CONSTELLATION_VALUES[0]]
+        self.insert_entries(
+            row,
+            [AlmanacConfig(system=default_system, name="") for _ in range(count)],
+        )
+        return True
+
+    def insert_entries(self, row, almanac_list):
+        """Insert AlmanacConfig entries at row as a single batch."""
+        if not almanac_list:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(almanac_list) - 1)
+        self._data[row:row] = almanac_list
+        self.endInsertRows()
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if count <= 0 or parent.isValid() or row + count > len(self._data):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._data[row : row + count]
+        self.endRemoveRows()
+        return True
+
+    def set_almanac(self, almanac_list):
+        """Show and edit the given almanac list; the list is not copied."""
+        self.beginResetModel()
+        self._data = almanac_list
+        self.endResetModel()
+
+
+class ConstellationDelegate(QStyledItemDelegate):
+    """Delegate that edits the system column with a transient combo box."""
+
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.setModel(_get_constellation_model())
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.ItemDataRole.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
 
 
 class AlmanacTab(QWidget):
@@ -29,6 +157,8 @@ class AlmanacTab(QWidget):
     def __init__(self, config: GNSSSignalSimConfig):
         super().__init__()
         self.config = config
+        self._batch_depth = 0  # Nesting level of batch_update() blocks
+        self._batch_pending = False  # A change was deferred by batch_update()
         self.init_ui()
 
     def init_ui(self):
@@ -37,30 +167,18 @@ class AlmanacTab(QWidget):
         self.setLayout(layout)
 
         almanac_group = QGroupBox("Almanac Settings")
-        almanac_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid #20c997;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #20c997;
-            }
-        """)
+        almanac_group.setObjectName(ALMANAC_GROUP)
         layout.addWidget(almanac_group)
 
         grid = QGridLayout()
         almanac_group.setLayout(grid)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["System", "File Path", ""])
+        self.model = AlmanacModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.system_delegate = ConstellationDelegate(self.table)
+        self.table.setItemDelegateForColumn(0, self.system_delegate)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch
         )
@@ -70,60 +188,93 @@ class AlmanacTab(QWidget):
         self.add_button.clicked.connect(self.add_almanac)
         grid.addWidget(self.add_button, 1, 0)
 
+        self.remove_button = QPushButton("Remove Almanac")
+        self.remove_button.clicked.connect(self.remove_almanac)
+        grid.addWidget(self.remove_button, 1, 1)
+
+        # One shared file dialog entry point instead of a path editor per row
+        self.browse_button = QPushButton("Browse...")
+        self.browse_button.clicked.connect(self.browse_almanac_file)
+        grid.addWidget(self.browse_button, 1, 2)
+
         self.refresh_from_config()
 
-    def add_almanac(self):
-        """Add a new almanac entry to the table."""
-        row_position = self.table.rowCount()
-        self.table.insertRow(row_position)
+        # Connect after the initial load so it does not emit config_changed
+        self.model.dataChanged.connect(self.update_config)
+        self.model.rowsInserted.connect(self.update_config)
+        self.model.rowsRemoved.connect(self.update_config)
 
-        system_combo = QComboBox()
-        for const_type in ConstellationType:
-            system_combo.addItem(const_type.value)
-        self.table.setCellWidget(row_position, 0, system_combo)
+    def _insert_row(self, almanac_config: AlmanacConfig | None = None) -> int:
+        """Append an almanac entry, a default one if none given; return its row."""
+        row_position = self.model.rowCount()
+        if almanac_config is None:
+            self.model.insertRow(row_position)
+        else:
+            self.model.insert_entries(row_position, [almanac_config])
+        return row_position
 
-        file_path_edit = QLineEdit()
-        self.table.setCellWidget(row_position, 1, file_path_edit)
+    def add_almanac(self):
+        """Add a new almanac entry to the table."""
+        row_position = self._insert_row()
+        self.table.setCurrentIndex(self.model.index(row_position, 1))
 
-        remove_button = QPushButton("Remove")
-        remove_button.clicked.connect(lambda: self.remove_almanac(row_position))
-        self.table.setCellWidget(row_position, 2, remove_button)
+    def remove_almanac(self):
+        """Remove the selected almanac entries from the table."""
+        rows = {index.row() for index in self.table.selectionModel().selectedRows()}
+        if not rows:
+            current_row = self.table.currentIndex().row()
+            if current_row < 0:
+                return
+            rows = {current_row}
+        # Remove bottom-up so the remaining row numbers stay valid
+        with self.batch_update():
+            for row in sorted(rows, reverse=True):
+                self.model.removeRow(row)
 
-    def remove_almanac(self, row):
-        """Remove an almanac entry from the table."""
-        self.table.removeRow(row)
-        self.update_config()
+    def browse_almanac_file(self):
+        """Choose the file path of the current almanac entry."""
+        row = self.table.currentIndex().row()
+        if row < 0:
+            return
+        name_index = self.model.index(row, 1)
+        current_name = name_index.data(Qt.ItemDataRole.EditRole)
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Choose Almanac File",
+            current_name or get_default_path("ephemeris"),
+            "All Files (*)",
+        )
+        if file_path:
+            self.model.setData(name_index, file_path)
 
     def refresh_from_config(self):
         """Refresh the UI from the config model."""
-        self.table.setRowCount(0)
-        for almanac_config in self.config.almanac:
-            self.add_almanac_from_config(almanac_config)
+        # A single model reset repaints once and emits no per-row signals
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_almanac(self.config.almanac)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def add_almanac_from_config(self, almanac_config: AlmanacConfig):
         """Add a row to the table from an AlmanacConfig object."""
-        row_position = self.table.rowCount()
-        self.table.insertRow(row_position)
-
-        system_combo = QComboBox()
-        for const_type in ConstellationType:
-            system_combo.addItem(const_type.value)
-        system_combo.setCurrentText(almanac_config.system.value)
-        self.table.setCellWidget(row_position, 0, system_combo)
-
-        file_path_edit = QLineEdit(almanac_config.name)
-        self.table.setCellWidget(row_position, 1, file_path_edit)
-
-        remove_button = QPushButton("Remove")
-        remove_button.clicked.connect(lambda: self.remove_almanac(row_position))
-        self.table.setCellWidget(row_position, 2, remove_button)
-
-    def update_config(self):
-        """Update the config model from the UI."""
-        almanac_list = []
-        for row in range(self.table.rowCount()):
-            system = ConstellationType(self.table.cellWidget(row, 0).currentText())
-            name = self.table.cellWidget(row, 1).text()
-            almanac_list.append(AlmanacConfig(system=system, name=name))
-        self.config.almanac = almanac_list
+        self._insert_row(almanac_config)
+
+    @contextmanager
+    def batch_update(self):
+        """Emit a single config_changed for all edits made inside the block."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_pending:
+                self._batch_pending = False
+                self.config_changed.emit()
+
+    def update_config(self, *args):
+        """Notify listeners; the model already edited config.almanac in place."""
+        if self._batch_depth:
+            self._batch_pending = True
+            return
         self.config_changed.emit()
@@ -7,6 +7,8 @@ GitHub: https://github.com/MuhammadQaisarAli
 This tab handles basic configuration settings like version, description, and comments.
 """
 
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -19,9 +21,47 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QGridLayout,
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QSignalBlocker, QStringListModel
+from gui.styles import BASIC_GROUP, SUMMARY_GROUP, SUMMARY_LABEL
 from core.config.models import GNSSSignalSimConfig
 
+# Preset versions offered in the combo box, pre-parsed
+_VERSION_MAP = {"1.0": 1.0, "1.1": 1.1, "1.2": 1.2, "2.0": 2.0}
+
+
+_version_model = None  # Shared item model for every version combo box
+
+
+def _get_version_model() -> QStringListModel:
+    """Return the version list model, creating it on first use."""
+    global _version_model
+    if _version_model is None:
+        _version_model = QStringListModel(list(_VERSION_MAP))
+    return _version_model
+
+
+def _parse_version(text: str) -> float:
+    """Convert version combo text to a float, defaulting to 1.0."""
+    text = text.strip()
+    version = _VERSION_MAP.get(text)
+    if version is not None:
+        return version
+    try:
+        return float(text)
+    except ValueError:
+        return 1.0
+
+
+@contextmanager
+def _block_signals(*widgets):
+    """Block signals of all widgets for the duration of the block."""
+    blockers = [QSignalBlocker(widget) for widget in widgets]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
 
 class BasicTab(QWidget):
     """Basic configuration tab."""
@@ -31,6 +71,16 @@ class BasicTab(QWidget):
     def __init__(self, config: GNSSSignalSimConfig):
         super().__init__()
         self.config = config
+
+        # Coalesce keystrokes in the text fields into one config update
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(150)
+        self._update_timer.timeout.connect(self.update_config)
+
+        self._last_summary = None  # Text currently shown in summary_label
+        self._summary_dirty = True  # Summary is rebuilt lazily while hidden
+
         self.init_ui()
         self.connect_signals()
         self.refresh_from_config()
@@ -44,30 +94,17 @@ class BasicTab(QWidget):
 
         # Basic Information Group with responsive layout
         basic_group = QGroupBox("Basic Information")
-        basic_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid #007acc;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #007acc;
-            }
-        """)
+        basic_group.setObjectName(BASIC_GROUP)
         basic_layout = QGridLayout(basic_group)
         basic_layout.setSpacing(10)
 
         # Row 0: Version (compact)
         basic_layout.addWidget(QLabel("Version:"), 0, 0)
         self.version_combo = QComboBox()
-        self.version_combo.addItems(["1.0", "1.1", "1.2", "2.0"])
+        self.version_combo.setModel(_get_version_model())
         self.version_combo.setEditable(True)
+        # Typed versions must not be appended to the shared model
+        self.version_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.version_combo.setMaximumWidth(120)
         self.version_combo.setSizePolicy(
             QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed
@@ -104,22 +141,7 @@ class BasicTab(QWidget):
 
         # Configuration Summary Group
         summary_group = QGroupBox("Configuration Summary")
-        summary_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid #28a745;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #28a745;
-            }
-        """)
+        summary_group.setObjectName(SUMMARY_GROUP)
         summary_layout = QVBoxLayout(summary_group)
 
         self.summary_label = QLabel("Configuration summary will be displayed here...")
@@ -129,17 +151,7 @@ class BasicTab(QWidget):
         self.summary_label.setSizePolicy(
             QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding
         )
-        self.summary_label.setStyleSheet("""
-            QLabel {
-                background-color: #343a40;
-                padding: 15px;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 11px;
-                line-height: 1.4;
-            }
-        """)
+        self.summary_label.setObjectName(SUMMARY_LABEL)
         summary_layout.addWidget(self.summary_label)
 
         main_layout.addWidget(summary_group)
@@ -153,52 +165,74 @@ class BasicTab(QWidget):
     def connect_signals(self):
         """Connect widget signals to update configuration."""
         self.version_combo.currentTextChanged.connect(self.update_config)
-        self.description_edit.textChanged.connect(self.update_config)
-        self.comment_edit.textChanged.connect(self.update_config)
+        self.description_edit.textChanged.connect(self._schedule_update)
+        self.comment_edit.textChanged.connect(self._schedule_update)
+
+    def _schedule_update(self, *args):
+        """Restart the debounce timer for text field edits."""
+        self._update_timer.start()
 
     def update_config(self):
         """Update configuration from widget values."""
-        try:
-            self.config.version = float(self.version_combo.currentText())
-        except ValueError:
-            self.config.version = 1.0
+        # Also flushes any pending debounced text edit
+        self._update_timer.stop()
+
+        self.config.version = _parse_version(self.version_combo.currentText())
 
         self.config.description = self.description_edit.text()
-        self.config.comment = self.comment_edit.toPlainText()
+        # Only copy the comment out of the document when it was edited
+        comment_document = self.comment_edit.document()
+        if comment_document.isModified():
+            self.config.comment = self.comment_edit.toPlainText()
+            comment_document.setModified(False)
 
         self.update_summary()
         self.config_changed.emit()
 
+    def showEvent(self, event):
+        """Build a summary that went stale while the tab was hidden."""
+        super().showEvent(event)
+        if self._summary_dirty:
+            self.update_summary()
+
     def update_summary(self):
         """Update the configuration summary."""
-        summary_parts = []
+        if not self.isVisible():
+            self._summary_dirty = True
+            return
+        self._summary_dirty = False
 
-        summary_parts.append(f"Version: {self.config.version}")
+        summary_parts = [f"Version: {self.config.version}"]
 
         if self.config.description:
             summary_parts.append(f"Description: {self.config.description}")
 
-        if self.config.comment:
-            comment_preview = self.config.comment[:100]
-            if len(self.config.comment) > 100:
-                comment_preview += "..."
-            summary_parts.append(f"Comments: {comment_preview}")
+        comment = self.config.comment
+        if comment:
+            if len(comment) > 100:
+                comment = comment[:100] + "..."
+            summary_parts.append(f"Comments: {comment}")
 
-        # Add basic stats
-        enabled_systems = [s for s in self.config.output.system_select if s.enable]
-        summary_parts.append(f"Enabled Signals: {len(enabled_systems)}")
+        # Add basic stats (cached on OutputSettings until mark_dirty())
+        enabled_count = len(self.config.output.enabled_signals)
+        summary_parts.append(f"Enabled Signals: {enabled_count}")
 
         summary_text = "\n".join(summary_parts)
+        # Unchanged text would only trigger a needless relayout and repaint
+        if summary_text == self._last_summary:
+            return
+        self._last_summary = summary_text
         self.summary_label.setText(summary_text)
 
     def refresh_from_config(self):
         """Refresh widget values from configuration."""
-        # Block signals to prevent recursive updates
-        self.version_combo.blockSignals(True)
-        self.description_edit.blockSignals(True)
-        self.comment_edit.blockSignals(True)
+        # Drop pending text edits so they cannot overwrite the new values
+        self._update_timer.stop()
 
-        try:
+        # Block signals to prevent recursive updates
+        with _block_signals(
+            self.version_combo, self.description_edit, self.comment_edit
+        ):
             # Set version
             version_text = str(self.config.version)
             index = self.version_combo.findText(version_text)
@@ -213,9 +247,3 @@ class BasicTab(QWidget):
 
             # Update summary
             self.update_summary()
-
-        finally:
-            # Re-enable signals
-            self.version_combo.blockSignals(False)
-            self.description_edit.blockSignals(False)
-            self.comment_edit.blockSignals(False)
@@ -9,6 +9,8 @@ with validation that the simulation time falls within ephemeris validity range.
 """
 
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
     QWidget,
@@ -20,34 +22,381 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QLabel,
     QSizePolicy,
-    QListWidget,
+    QListView,
     QSpinBox,
     QDoubleSpinBox,
     QDateTimeEdit,
     QFrame,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QCheckBox,
     QAbstractItemView,
     QMessageBox,
     QStackedWidget,
 )
-from PyQt6.QtCore import pyqtSignal, QDateTime, Qt
+from PyQt6.QtCore import (
+    pyqtSignal,
+    QDateTime,
+    Qt,
+    QAbstractTableModel,
+    QIdentityProxyModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+)
+from PyQt6.QtGui import QBrush
+
+from gui.styles import EPHEMERIS_GROUP, EPHEMERIS_LIST, EPHEMERIS_TABLE, TIME_VALIDATION_GROUP
 from core.config.models import GNSSSignalSimConfig, EphemerisType, EphemerisConfig, TimeType
+from core.data.rinex_parser import (
+    parse_rinex_file_cached,
+    is_rinex_parse_cached,
+    is_valid_rinex_file,
+)
 from core.utils.logger import debug, info
 from core.utils.settings import get_default_path
+from core.workflow.manager import ValidationStatus
+
+# Week-number epochs of the satellite time systems
+_TIME_EPOCHS = {
+    TimeType.GPS: datetime(1980, 1, 6),
+    TimeType.BDS: datetime(2006, 1, 1),
+    TimeType.GALILEO: datetime(1999, 8, 22),
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_rinex_filename_range(filename: str):
+    """Estimate (start, end, constellations) from a RINEX file name, or None."""
+    if len(filename) <= 15:
+        return None
+    year_day = filename[12:19]  # e.g., "2021170"
+    if not (year_day.isdigit() and len(year_day) == 7):
+        return None
+    try:
+        year = int(year_day[:4])
+        day_of_year = int(year_day[4:])
+
+        # Convert to datetime
+        file_date = datetime(year, 1, 1) + timedelta(days=day_of_year - 1)
+    except (ValueError, OverflowError) as e:
+        debug(f"Error parsing filename for time range: {e}")
+        return None
+
+    # Assume ephemeris is valid for ±2 hours around the file date
+    file_start = file_date - timedelta(hours=2)
+    file_end = file_date + timedelta(hours=26)  # +4 hours from end of day
+
+    # Estimate constellation from filename
+    constellations = ("GPS",)  # Default
+    if "_MN" in filename or "BRDC" in filename:
+        constellations = ("GPS", "GLO", "GAL", "BDS")  # Multi-constellation
+    return file_start, file_end, constellations
+
+
+# Status cell brushes, shared by every row instead of converted per cell
+_GRAY_BRUSH = QBrush(Qt.GlobalColor.gray)
+_RED_BRUSH = QBrush(Qt.GlobalColor.red)
+_YELLOW_BRUSH = QBrush(Qt.GlobalColor.yellow)
+_GREEN_BRUSH = QBrush(Qt.GlobalColor.green)
+_WHITE_BRUSH = QBrush(Qt.GlobalColor.white)
+_BLACK_BRUSH = QBrush(Qt.GlobalColor.black)
+
+
+def _format_file_columns(eph_config, file_range, pending):
+    """Build the file name, constellations, time range and duration texts of a row."""
+    filename = eph_config.basename
+    if pending:
+        # File is still being parsed in the background
+        return (filename, "Analyzing...", "Unknown", "N/A")
+    if file_range is None:
+        # No file information available
+        return (filename, "Not analyzed", "Unknown", "N/A")
+
+    _, start_time, end_time, constellations = file_range
+    if not (start_time and end_time):
+        # File couldn't be parsed
+        return (filename, "Parse failed", "Unknown", "N/A")
+
+    const_str = ", ".join(sorted(constellations)) if constellations else "Unknown"
+    time_range = f"{start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')} UTC"
+    duration = (end_time - start_time).total_seconds() / 3600
+    return (filename, const_str, time_range, f"{duration:.1f}h")
+
+
+def _format_status(file_range, sim_time, pending):
+    """Build the simulation time status text and brushes of a row."""
+    if pending:
+        return "⏳ Analyzing file...", _GRAY_BRUSH, _WHITE_BRUSH
+    if file_range is None:
+        return "⚠️ Not analyzed", _GRAY_BRUSH, _WHITE_BRUSH
+
+    _, start_time, end_time, _ = file_range
+    if not (start_time and end_time):
+        return "❌ File parse error", _RED_BRUSH, _WHITE_BRUSH
+    if not sim_time:
+        return "⚠️ Set simulation time", _YELLOW_BRUSH, _BLACK_BRUSH
+
+    # One signed offset per row gives both distances to the range ends
+    offset = sim_time - start_time
+    length = end_time - start_time
+    if timedelta(0) <= offset <= length:
+        # Time is valid for this file
+        hours_from_start = offset.total_seconds() / 3600
+        hours_to_end = (length - offset).total_seconds() / 3600
+        text = f"✅ VALID ({hours_from_start:.1f}h from start, {hours_to_end:.1f}h to end)"
+        return text, _GREEN_BRUSH, _WHITE_BRUSH
+
+    # Time is outside this file's range
+    if offset < timedelta(0):
+        text = f"❌ Too early ({-offset.total_seconds() / 3600:.1f}h before start)"
+    else:
+        text = f"❌ Too late ({(offset - length).total_seconds() / 3600:.1f}h after end)"
+    return text, _RED_BRUSH, _WHITE_BRUSH
+
+
+class EphemerisTableModel(QAbstractTableModel):
+    """Read-only view of the ephemeris files with a checkable Included column."""
+
+    HEADERS = (
+        "File Name", "Constellations", "Valid Time Range", "Duration",
+        "Simulation \nStart Time Status", "Included",
+    )
+    STATUS_COLUMN = 4
+    INCLUDE_COLUMN = 5
+
+    include_toggled = pyqtSignal(int, int)  # row, Qt.CheckState value
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ephemeris = []  # The config's ephemeris list, not a copy
+        self._file_ranges = []
+        self._sim_time = None
+        self._pending = frozenset()
+        # Row texts are formatted on first request, so rows Qt never asks for
+        # cost nothing; file columns survive time changes, statuses do not
+        self._file_texts = []
+        self._statuses = []
+
+    def set_rows(self, ephemeris, file_ranges, sim_time, pending=frozenset()):
+        """Point the model at new row sources and refresh only what changed."""
+        pending = frozenset(pending)
+        row_count = len(ephemeris)
+
+        if row_count != len(self._file_texts) or ephemeris is not self._ephemeris:
+            self.beginResetModel()
+            self._ephemeris = ephemeris
+            self._file_ranges = file_ranges
+            self._sim_time = sim_time
+            self._pending = pending
+            self._file_texts = [None] * row_count
+            self._statuses = [None] * row_count
+            self.endResetModel()
+            return
+
+        if not row_count:
+            return
+
+        if file_ranges is not self._file_ranges or pending != self._pending:
+            self._file_ranges = file_ranges
+            self._sim_time = sim_time
+            self._pending = pending
+            self._file_texts = [None] * row_count
+            self._statuses = [None] * row_count
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(row_count - 1, self.STATUS_COLUMN)
+            )
+        elif sim_time != self._sim_time:
+            # Only the status column depends on the simulation time
+            self._sim_time = sim_time
+            self._statuses = [None] * row_count
+            self.dataChanged.emit(
+                self.index(0, self.STATUS_COLUMN),
+                self.index(row_count - 1, self.STATUS_COLUMN),
+            )
+
+    def ephemeris_at(self, row):
+        """Return the EphemerisConfig shown in the given row."""
+        return self._ephemeris[row]
+
+    def _file_range(self, row):
+        return self._file_ranges[row] if row < len(self._file_ranges) else None
+
+    def _is_pending(self, row):
+        return self._ephemeris[row].name in self._pending
+
+    def _row_file_texts(self, row):
+        texts = self._file_texts[row]
+        if texts is None:
+            texts = _format_file_columns(
+                self._ephemeris[row], self._file_range(row), self._is_pending(row)
+            )
+            self._file_texts[row] = texts
+        return texts
+
+    def _row_status(self, row):
+        status = self._statuses[row]
+        if status is None:
+            status = _format_status(
+                self._file_range(row), self._sim_time, self._is_pending(row)
+            )
+            self._statuses[row] = status
+        return status
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if count <= 0 or parent.isValid() or row + count > len(self._file_texts):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._ephemeris[row : row + count]
+        del self._file_ranges[row : row + count]
+        del self._file_texts[row : row + count]
+        del self._statuses[row : row + count]
+        self.endRemoveRows()
+        return True
+
+    def refresh_include_column(self):
+        """Repaint the Included check boxes after include flags changed."""
+        if self._file_texts:
+            self.dataChanged.emit(
+                self.index(0, self.INCLUDE_COLUMN),
+                self.index(len(self._file_texts) - 1, self.INCLUDE_COLUMN),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._file_texts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if column == self.INCLUDE_COLUMN:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                include = self._ephemeris[row].include
+                return Qt.CheckState.Checked if include else Qt.CheckState.Unchecked
+            return None
+
+        if column == self.STATUS_COLUMN:
+            # Qt also queries size, font and alignment roles; only format
+            # the status when one of its own roles is requested
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._row_status(row)[0]
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._row_status(row)[1]
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._row_status(row)[2]
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._row_file_texts(row)[column]
+        if role == Qt.ItemDataRole.ToolTipRole and column == 0:
+            return self._ephemeris[row].name  # Full path as tooltip
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (
+            not index.isValid()
+            or index.column() != self.INCLUDE_COLUMN
+            or role != Qt.ItemDataRole.CheckStateRole
+        ):
+            return False
+        state = Qt.CheckState(value)
+        self._ephemeris[index.row()].include = state == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [role])
+        self.include_toggled.emit(index.row(), state.value)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.INCLUDE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class _EphemerisListModel(QIdentityProxyModel):
+    """Shows the rows of an EphemerisTableModel as "type: file name" items."""
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            eph_config = self.sourceModel().ephemeris_at(index.row())
+            return f"{eph_config.type.value}: {eph_config.basename}"
+        return super().data(index, role)
+
+
+class _RinexParseEmitter(QObject):
+    """Delivers background RINEX parse completions to the GUI thread."""
+
+    parsed = pyqtSignal(str)  # file path
+
+
+class _RinexParseTask(QRunnable):
+    """Parses one RINEX file into the shared parse cache off the GUI thread."""
+
+    def __init__(self, emitter, file_path):
+        super().__init__()
+        self.emitter = emitter
+        self.file_path = file_path
+
+    def run(self):
+        try:
+            parse_rinex_file_cached(self.file_path)
+        except Exception as e:
+            # The failure is cached too; analysis reports it as a parse error
+            debug(f"Background parse of {self.file_path} failed: {e}")
+        self.emitter.parsed.emit(self.file_path)
 
 
 class EphemerisTimeTab(QWidget):
     """Merged Ephemeris and Time configuration tab with validity checking."""
 
     config_changed = pyqtSignal()
+    ephemeris_analyzed = pyqtSignal()  # Background parsing updated the file ranges
 
     def __init__(self, config: GNSSSignalSimConfig):
         super().__init__()
         self.config = config
         self.ephemeris_file_ranges = []  # List of (file_info, start_time, end_time, constellations) tuples
+        # Names in config.ephemeris, kept in step with it for duplicate checks
+        self._ephemeris_name_set = set()
+        # RINEX files being parsed on the thread pool
+        self._parse_pending = set()
+        self._parse_emitter = _RinexParseEmitter(self)
+        self._parse_emitter.parsed.connect(self._on_rinex_parsed)
+        # Table rebuilds deferred by _batched()
+        self._batch_depth = 0
+        self._batch_table_dirty = False
+        # Coalesce config_changed emits made in one event loop cycle
+        self._config_changed_pending = False
+        self._config_timer = QTimer(self)
+        self._config_timer.setSingleShot(True)
+        self._config_timer.setInterval(0)
+        self._config_timer.timeout.connect(self._emit_config_changed)
+        # Set while refresh_from_config() writes widgets; change handlers skip work
+        self._loading = False
+        # Per-file "simulation time within range" flags and the (file ranges,
+        # range count, simulation time) they were computed for
+        self._valid_cache = []
+        self._valid_cache_key = None
+        # Style currently applied to the warning label
+        self._warning_style = None
+        # Outcome of the last validate_current_time(); None until a time can be checked
+        self.last_time_validation = None
         self.init_ui()
         self.connect_signals()
         self.refresh_from_config()
@@ -59,21 +408,7 @@ class EphemerisTimeTab(QWidget):
 
         # Step 1: Ephemeris Configuration Group
         ephemeris_group = QGroupBox("Load Ephemeris Files")
-        ephemeris_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid #007acc;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        ephemeris_group.setObjectName(EPHEMERIS_GROUP)
         ephemeris_layout = QHBoxLayout(ephemeris_group) # Changed to QHBoxLayout for overall group
 
         # Left side: Ephemeris type selection and buttons (vertical group)
@@ -102,26 +437,17 @@ class EphemerisTimeTab(QWidget):
         left_controls_layout.addStretch() # Push buttons to top
         ephemeris_layout.addLayout(left_controls_layout)
         
-        # Right side: File list
-        self.ephemeris_list_widget = QListWidget()
+        # Right side: File list, a second view of the validation table's model
+        self.ephemeris_model = EphemerisTableModel(self)
+        self.ephemeris_model.include_toggled.connect(self.on_include_changed)
+        self.ephemeris_list_model = _EphemerisListModel(self)
+        self.ephemeris_list_model.setSourceModel(self.ephemeris_model)
+        self.ephemeris_list_view = QListView()
+        self.ephemeris_list_view.setModel(self.ephemeris_list_model)
         
-        self.ephemeris_list_widget.setStyleSheet("""
-            QListWidget {
-                background-color: #343a40;
-                color: #f8f9fa;
-                border: 1px solid #495057;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #0078d4; /* Blue color for selected item */
-                color: #ffffff;
-            }
-        """)
-        self.ephemeris_list_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.MinimumExpanding)
-        ephemeris_layout.addWidget(self.ephemeris_list_widget, 1) # Give it more space
+        self.ephemeris_list_view.setObjectName(EPHEMERIS_LIST)
+        self.ephemeris_list_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.MinimumExpanding)
+        ephemeris_layout.addWidget(self.ephemeris_list_view, 1) # Give it more space
 
         # Make the ephemeris group resizable
         ephemeris_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.MinimumExpanding)
@@ -129,21 +455,7 @@ class EphemerisTimeTab(QWidget):
 
         # Step 2: Time Configuration and Ephemeris Validation
         config_group = QGroupBox("Time Configuration and Ephemeris Validation")
-        config_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 2px solid #28a745;
-                border-radius: 8px;
-                margin-top: 5px; /* Reduced margin */
-                padding-top: 5px; /* Reduced padding */
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        config_group.setObjectName(TIME_VALIDATION_GROUP)
         config_layout = QVBoxLayout(config_group)
         config_layout.setSpacing(5) # Reduced spacing
 
@@ -227,66 +539,32 @@ class EphemerisTimeTab(QWidget):
         table_label.setStyleSheet("font-weight: bold; margin-top: 5px;") # Reduced margin
         config_layout.addWidget(table_label)
         
-        self.ephemeris_table = QTableWidget()
-        self.ephemeris_table.setColumnCount(6)
-        self.ephemeris_table.setHorizontalHeaderLabels([
-            "File Name", "Constellations", "Valid Time Range", "Duration", "Simulation \nStart Time Status", "Included"
-        ])
+        self.ephemeris_table = QTableView()
+        self.ephemeris_table.setModel(self.ephemeris_model)
         
-        # Set column widths
+        # Set column widths once from the longest expected texts; ResizeToContents
+        # would re-measure every cell on each table refresh
         header = self.ephemeris_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # File Name
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Constellations
+        metrics = self.ephemeris_table.fontMetrics()
+        for column, longest_text in (
+            (0, "BRDC00IGS_R_20211700000_01D_MN.rnx"),  # File Name
+            (1, "BDS, GAL, GLO, GPS"),                  # Constellations
+            (3, "Duration"),                            # Duration
+        ):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, metrics.horizontalAdvance(longest_text) + 24)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)           # Time Range
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Duration
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)           # Status
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Include checkbox
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)             # Include checkbox
+        header.resizeSection(5, 80) # Make it smaller
         
         # Make table expand to fill available space
         self.ephemeris_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.ephemeris_table.setAlternatingRowColors(True)
-        self.ephemeris_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.ephemeris_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         # Make table non-editable
         self.ephemeris_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.ephemeris_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #343a40;
-                alternate-background-color: #3E444A;
-                gridline-color: #495057;
-                color: #f8f9fa;
-                font-family: 'Segoe UI', 'Consolas', 'Monaco', monospace;
-                font-size: 10px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #495057;
-            }
-            QTableWidget::item:selected {
-                background-color: #0078d4;
-                color: #ffffff;
-            }
-            QTableWidget::item:hover {
-                background-color: #454a4f;
-            }
-            QHeaderView::section {
-                background-color: #2c3136;
-                color: #f8f9fa;
-                padding: 8px;
-                border: 1px solid #495057;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QHeaderView::section:horizontal:last-child {
-                border-right: none;
-            }
-            QHeaderView::section:vertical:last-child {
-                border-bottom: none;
-            }
-            QTableCornerButton::section {
-                background-color: #2c3136;
-                border: 1px solid #495057;
-            }
-        """)
+        self.ephemeris_table.setObjectName(EPHEMERIS_TABLE)
 
         config_layout.addWidget(self.ephemeris_table)
 
@@ -301,10 +579,6 @@ class EphemerisTimeTab(QWidget):
         header_layout.addWidget(self.select_all_checkbox)
         header_layout.addStretch()
         
-        # Set the header widget for the Include column
-        self.ephemeris_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-        self.ephemeris_table.horizontalHeader().resizeSection(5, 80) # Make it smaller
-        
         # Add warning label and select all checkbox
         controls_layout = QHBoxLayout()
         
@@ -341,7 +615,7 @@ class EphemerisTimeTab(QWidget):
         """Connect widget signals."""
         # Ephemeris signals
         self.type_combo.currentTextChanged.connect(self.update_config)
-        self.ephemeris_list_widget.itemSelectionChanged.connect(self.update_ephemeris_info)
+        self.ephemeris_list_view.selectionModel().selectionChanged.connect(self.update_ephemeris_info)
 
         # Time signals
         self.time_type_combo.currentTextChanged.connect(self.on_time_type_changed)
@@ -370,7 +644,7 @@ class EphemerisTimeTab(QWidget):
 
         if file_paths:
             # Check for duplicates and only add new files
-            existing_files = {eph.name for eph in self.config.ephemeris}
+            existing_files = self._ephemeris_name_set
             added_count = 0
             
             for file_path in file_paths:
@@ -381,10 +655,11 @@ class EphemerisTimeTab(QWidget):
                     added_count += 1
             
             if added_count > 0:
-                self.refresh_ephemeris_list()
-                self.analyze_ephemeris_validity()
-                self.validate_current_time()
-                self.update_config()
+                with self._batched():
+                    self.refresh_ephemeris_list()
+                    self.analyze_ephemeris_validity()
+                    self.validate_current_time()
+                    self.update_config()
             
             if added_count < len(file_paths):
                 skipped_count = len(file_paths) - added_count
@@ -399,125 +674,91 @@ class EphemerisTimeTab(QWidget):
 
     def remove_ephemeris_file(self):
         """Remove selected ephemeris file."""
-        selected_items = self.ephemeris_list_widget.selectedItems()
-        if not selected_items:
+        selected_rows = {index.row() for index in self.ephemeris_list_view.selectedIndexes()}
+        if not selected_rows:
             return
 
-        for item in selected_items:
-            row = self.ephemeris_list_widget.row(item)
-            if 0 <= row < len(self.config.ephemeris):
-                del self.config.ephemeris[row]
-        
-        self.refresh_ephemeris_list()
-        self.analyze_ephemeris_validity()
-        self.validate_current_time()
-        self.update_config()
+        with self._batched():
+            # Remove bottom-up so the remaining row numbers stay valid; the
+            # model deletes from config.ephemeris
+            for row in sorted(selected_rows, reverse=True):
+                if 0 <= row < len(self.config.ephemeris):
+                    self._ephemeris_name_set.discard(self.config.ephemeris[row].name)
+                    self.ephemeris_model.removeRow(row)
+
+            self.refresh_ephemeris_list()
+            self.analyze_ephemeris_validity()
+            self.validate_current_time()
+            self.update_config()
 
     def refresh_ephemeris_list(self):
-        """Refresh the ephemeris file list (simplified display)."""
-        self.ephemeris_list_widget.clear()
-        
-        for eph_config in self.config.ephemeris:
-            filename = os.path.basename(eph_config.name)
-            display_text = f"{eph_config.type.value}: {filename}"
-            self.ephemeris_list_widget.addItem(display_text)
-        
-        # Also update the table
+        """Refresh the ephemeris file list and table (simplified display)."""
+        # The list view shares the table's model
         self.update_ephemeris_table()
         
         # Update select all checkbox and warning
         self.update_select_all_checkbox()
         self.update_warning_visibility()
 
+    @contextmanager
+    def _batched(self):
+        """Defer table rebuilds until the outermost block exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_table_dirty:
+                self._batch_table_dirty = False
+                self.update_ephemeris_table()
+
+    def _schedule_config_changed(self):
+        """Emit config_changed once the current event loop cycle is done."""
+        if not self._config_changed_pending:
+            self._config_changed_pending = True
+            self._config_timer.start()
+
+    def _emit_config_changed(self):
+        """Emit the coalesced config_changed signal."""
+        self._config_changed_pending = False
+        self.config_changed.emit()
+
     def update_ephemeris_table(self):
         """Update the ephemeris validation table with current file information and time validation."""
-        # Set the number of rows to match the number of ephemeris files
-        self.ephemeris_table.setRowCount(len(self.config.ephemeris))
-        
-        # Get current simulation time for validation
-        sim_time = self.get_current_simulation_time()
-        
-        for i, eph_config in enumerate(self.config.ephemeris):
-            filename = os.path.basename(eph_config.name)
-            
-            # File Name column
-            file_item = QTableWidgetItem(filename)
-            file_item.setToolTip(eph_config.name)  # Full path as tooltip
-            self.ephemeris_table.setItem(i, 0, file_item)
-            
-            # Get file information
-            if i < len(self.ephemeris_file_ranges):
-                file_info, start_time, end_time, constellations = self.ephemeris_file_ranges[i]
-                
-                if start_time and end_time:
-                    # Constellations column
-                    const_str = ", ".join(sorted(constellations)) if constellations else "Unknown"
-                    const_item = QTableWidgetItem(const_str)
-                    self.ephemeris_table.setItem(i, 1, const_item)
-                    
-                    # Valid Time Range column
-                    time_range = f"{start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')} UTC"
-                    range_item = QTableWidgetItem(time_range)
-                    self.ephemeris_table.setItem(i, 2, range_item)
-                    
-                    # Duration column
-                    duration = (end_time - start_time).total_seconds() / 3600
-                    duration_item = QTableWidgetItem(f"{duration:.1f}h")
-                    self.ephemeris_table.setItem(i, 3, duration_item)
-                    
-                    # Simulation Time Status column
-                    if sim_time:
-                        if start_time <= sim_time <= end_time:
-                            # Time is valid for this file
-                            hours_from_start = (sim_time - start_time).total_seconds() / 3600
-                            hours_to_end = (end_time - sim_time).total_seconds() / 3600
-                            status_text = f"✅ VALID ({hours_from_start:.1f}h from start, {hours_to_end:.1f}h to end)"
-                            status_item = QTableWidgetItem(status_text)
-                            status_item.setBackground(Qt.GlobalColor.green)
-                            status_item.setForeground(Qt.GlobalColor.white)
-                        else:
-                            # Time is outside this file's range
-                            if sim_time < start_time:
-                                diff_hours = (start_time - sim_time).total_seconds() / 3600
-                                status_text = f"❌ Too early ({diff_hours:.1f}h before start)"
-                            else:
-                                diff_hours = (sim_time - end_time).total_seconds() / 3600
-                                status_text = f"❌ Too late ({diff_hours:.1f}h after end)"
-                            status_item = QTableWidgetItem(status_text)
-                            status_item.setBackground(Qt.GlobalColor.red)
-                            status_item.setForeground(Qt.GlobalColor.white)
-                    else:
-                        status_item = QTableWidgetItem("⚠️ Set simulation time")
-                        status_item.setBackground(Qt.GlobalColor.yellow)
-                        status_item.setForeground(Qt.GlobalColor.black)
-                    
-                    self.ephemeris_table.setItem(i, 4, status_item)
-                else:
-                    # File couldn't be parsed
-                    self.ephemeris_table.setItem(i, 1, QTableWidgetItem("Parse failed"))
-                    self.ephemeris_table.setItem(i, 2, QTableWidgetItem("Unknown"))
-                    self.ephemeris_table.setItem(i, 3, QTableWidgetItem("N/A"))
-                    
-                    status_item = QTableWidgetItem("❌ File parse error")
-                    status_item.setBackground(Qt.GlobalColor.red)
-                    status_item.setForeground(Qt.GlobalColor.white)
-                    self.ephemeris_table.setItem(i, 4, status_item)
-            else:
-                # No file information available
-                self.ephemeris_table.setItem(i, 1, QTableWidgetItem("Not analyzed"))
-                self.ephemeris_table.setItem(i, 2, QTableWidgetItem("Unknown"))
-                self.ephemeris_table.setItem(i, 3, QTableWidgetItem("N/A"))
-                
-                status_item = QTableWidgetItem("⚠️ Not analyzed")
-                status_item.setBackground(Qt.GlobalColor.gray)
-                status_item.setForeground(Qt.GlobalColor.white)
-                self.ephemeris_table.setItem(i, 4, status_item)
-            
-            # Include checkbox column (rightmost)
-            checkbox = QCheckBox()
-            checkbox.setChecked(eph_config.include)
-            checkbox.stateChanged.connect(lambda state, idx=i: self.on_include_changed(idx, state))
-            self.ephemeris_table.setCellWidget(i, 5, checkbox)
+        if self._batch_depth:
+            self._batch_table_dirty = True
+            return
+        # Repaint the table once after the model has been refreshed
+        self.ephemeris_table.setUpdatesEnabled(False)
+        try:
+            self.ephemeris_model.set_rows(
+                self.config.ephemeris,
+                self.ephemeris_file_ranges,
+                self.get_current_simulation_time(),
+                self._parse_pending,
+            )
+        finally:
+            self.ephemeris_table.setUpdatesEnabled(True)
+
+    def _start_background_parse(self, file_path: str):
+        """Parse a RINEX file on the thread pool unless already in progress."""
+        if file_path in self._parse_pending:
+            return
+        self._parse_pending.add(file_path)
+        QThreadPool.globalInstance().start(
+            _RinexParseTask(self._parse_emitter, file_path)
+        )
+
+    def _on_rinex_parsed(self, file_path: str):
+        """Re-analyze from the parse cache once all pending files are parsed."""
+        self._parse_pending.discard(file_path)
+        if self._parse_pending:
+            return
+        with self._batched():
+            self.analyze_ephemeris_validity()
+            self.validate_current_time()
+            self.update_warning_visibility()
+        self.ephemeris_analyzed.emit()
 
     def get_current_simulation_time(self):
         """Get the current simulation time as a datetime object."""
@@ -529,73 +770,58 @@ class EphemerisTimeTab(QWidget):
                 return qdt.toPyDateTime()
             else:
                 # Convert satellite time to UTC (simplified conversion)
-                week = self.week_spin.value()
                 second = self.second_spin.value()
-                
-                if time_type == TimeType.GPS:
-                    # GPS epoch: January 6, 1980
-                    gps_epoch = datetime(1980, 1, 6)
-                    return gps_epoch + timedelta(weeks=week, seconds=second)
-                elif time_type == TimeType.BDS:
-                    # BDS epoch: January 1, 2006
-                    bds_epoch = datetime(2006, 1, 1)
-                    return bds_epoch + timedelta(weeks=week, seconds=second)
-                elif time_type == TimeType.GALILEO:
-                    # Galileo epoch: August 22, 1999
-                    galileo_epoch = datetime(1999, 8, 22)
-                    return galileo_epoch + timedelta(weeks=week, seconds=second)
-                elif time_type == TimeType.GLONASS:
+
+                if time_type == TimeType.GLONASS:
                     # GLONASS uses leap year, day, and second
                     leap_year = self.leap_year_spin.value()
                     day = self.day_spin.value()
-                    second = self.second_spin.value()
                     return datetime(leap_year, 1, 1) + timedelta(days=day-1, seconds=second)
-                else:
-                    # Default to GPS time
-                    gps_epoch = datetime(1980, 1, 6)
-                    return gps_epoch + timedelta(weeks=week, seconds=second)
+
+                # Week-based systems; anything else defaults to GPS time
+                epoch = _TIME_EPOCHS.get(time_type, _TIME_EPOCHS[TimeType.GPS])
+                return epoch + timedelta(weeks=self.week_spin.value(), seconds=second)
         except Exception as e:
             debug(f"Error getting simulation time: {e}")
             return None
 
     def analyze_ephemeris_validity(self):
         """Analyze ephemeris files to determine individual validity ranges and constellations."""
-        # Clear previous file ranges
-        self.ephemeris_file_ranges = []
+        # One unanalyzed entry per file, replaced by index when a file is analyzed;
+        # non-RINEX, pending and unparsable files keep theirs
+        self.ephemeris_file_ranges = [(eph, None, None, []) for eph in self.config.ephemeris]
         
         if not self.config.ephemeris:
-            self.ephemeris_table.setRowCount(0)
+            self.update_ephemeris_table()
             return
 
         try:
-            # Try to use proper RINEX parser first
-            try:
-                from core.data.rinex_parser import parse_rinex_file, is_valid_rinex_file
-                use_rinex_parser = True
-            except ImportError:
-                use_rinex_parser = False
-                debug("RINEX parser not available, using fallback method")
-            
             file_details = []
             parsed_files = 0
             
             for i, eph_config in enumerate(self.config.ephemeris):
                 if eph_config.type == EphemerisType.RINEX:
                     file_path = eph_config.name
-                    filename = os.path.basename(file_path)
+                    filename = eph_config.basename
                     
-                    if use_rinex_parser and os.path.exists(file_path) and is_valid_rinex_file(file_path):
+                    if os.path.exists(file_path) and is_valid_rinex_file(file_path):
+                        if not is_rinex_parse_cached(file_path):
+                            # Parse off the GUI thread; the row shows as pending until done
+                            self._start_background_parse(file_path)
+                            continue
+
                         # Use proper RINEX parser
                         try:
-                            parse_result = parse_rinex_file(file_path)
+                            parse_result = parse_rinex_file_cached(file_path)
+                            validity_range = parse_result.get('validity_range')
                             
-                            if parse_result and parse_result.get('validity_range'):
-                                file_start, file_end = parse_result['validity_range']
-                                constellations = parse_result.get('satellite_systems', [])
+                            if validity_range:
+                                file_start, file_end = validity_range
+                                constellations = parse_result.get('satellite_systems') or []
                                 satellite_count = parse_result.get('satellite_count', 0)
                                 
                                 # Store individual file information
-                                self.ephemeris_file_ranges.append((eph_config, file_start, file_end, constellations))
+                                self.ephemeris_file_ranges[i] = (eph_config, file_start, file_end, constellations)
                                 
                                 parsed_files += 1
                                 file_details.append({
@@ -608,55 +834,27 @@ class EphemerisTimeTab(QWidget):
                                 })
                                 
                                 info(f"Parsed {filename}: {file_start} to {file_end}, Systems: {', '.join(constellations)}")
-                            else:
-                                # Add empty entry to maintain index alignment
-                                self.ephemeris_file_ranges.append((eph_config, None, None, []))
                         except Exception as e:
                             debug(f"Error parsing {file_path}: {str(e)}")
-                            self.ephemeris_file_ranges.append((eph_config, None, None, []))
                     else:
-                        # Use fallback filename parsing
-                        if len(filename) > 15:
-                            try:
-                                year_day = filename[12:19]  # e.g., "2021170"
-                                if year_day.isdigit() and len(year_day) == 7:
-                                    year = int(year_day[:4])
-                                    day_of_year = int(year_day[4:])
-                                    
-                                    # Convert to datetime
-                                    file_date = datetime(year, 1, 1) + timedelta(days=day_of_year - 1)
-                                    
-                                    # Assume ephemeris is valid for ±2 hours around the file date
-                                    file_start = file_date - timedelta(hours=2)
-                                    file_end = file_date + timedelta(hours=26)  # +4 hours from end of day
-                                    
-                                    # Estimate constellation from filename
-                                    constellations = ["GPS"]  # Default
-                                    if "_MN" in filename or "BRDC" in filename:
-                                        constellations = ["GPS", "GLO", "GAL", "BDS"]  # Multi-constellation
-                                    
-                                    # Store individual file information
-                                    self.ephemeris_file_ranges.append((eph_config, file_start, file_end, constellations))
-                                    
-                                    parsed_files += 1
-                                    file_details.append({
-                                        'name': filename,
-                                        'start': file_start,
-                                        'end': file_end,
-                                        'duration': (file_end - file_start).total_seconds() / 3600,
-                                        'constellations': constellations,
-                                        'satellite_count': 'estimated'
-                                    })
-                                else:
-                                    self.ephemeris_file_ranges.append((eph_config, None, None, []))
-                            except Exception as e:
-                                debug(f"Error parsing filename for time range: {e}")
-                                self.ephemeris_file_ranges.append((eph_config, None, None, []))
-                        else:
-                            self.ephemeris_file_ranges.append((eph_config, None, None, []))
-                else:
-                    # Non-RINEX files - add empty entry to maintain index alignment
-                    self.ephemeris_file_ranges.append((eph_config, None, None, []))
+                        # Use fallback filename parsing (memoized per file name)
+                        estimate = _parse_rinex_filename_range(filename)
+                        if estimate is not None:
+                            file_start, file_end, constellations = estimate
+                            constellations = list(constellations)
+                            
+                            # Store individual file information
+                            self.ephemeris_file_ranges[i] = (eph_config, file_start, file_end, constellations)
+                            
+                            parsed_files += 1
+                            file_details.append({
+                                'name': filename,
+                                'start': file_start,
+                                'end': file_end,
+                                'duration': (file_end - file_start).total_seconds() / 3600,
+                                'constellations': constellations,
+                                'satellite_count': 'estimated'
+                            })
             
             # Update the table with the analyzed files
             if parsed_files > 0:
@@ -677,6 +875,8 @@ class EphemerisTimeTab(QWidget):
 
     def on_time_type_changed(self):
         """Handle time type change."""
+        if self._loading:
+            return
         self.update_time_widgets()
         self.validate_time_and_update()
 
@@ -699,35 +899,87 @@ class EphemerisTimeTab(QWidget):
 
     def validate_time_and_update(self):
         """Validate current time against ephemeris validity and update config."""
+        if self._loading:
+            return
         self.validate_current_time()
         self.update_warning_visibility()
         self.update_config()
 
     def validate_current_time(self):
         """Validate that current simulation time is within individual ephemeris file validity ranges."""
-        # Simply update the table - it will handle all the validation logic
+        # Update the table - it will handle all the per-file display logic
         self.update_ephemeris_table()
 
+        # Record the overall result for the workflow validators
+        sim_time = self.get_current_simulation_time()
+        if sim_time is None:
+            self.last_time_validation = None
+            return
+
+        if self._any_included_valid(sim_time):
+            self.last_time_validation = ValidationStatus.VALID
+        elif self.has_pending_included_files():
+            # A file still being parsed may cover the time; _on_rinex_parsed
+            # validates again once parsing is done
+            self.last_time_validation = None
+        else:
+            self.last_time_validation = ValidationStatus.INVALID
+
+    def _valid_flags(self, sim_time):
+        """Return per-file flags telling whether sim_time is within the file's range."""
+        ranges = self.ephemeris_file_ranges
+        key = self._valid_cache_key
+        if key is None or key[0] is not ranges or key[1] != len(ranges) or key[2] != sim_time:
+            self._valid_cache = [
+                bool(start_time and end_time and start_time <= sim_time <= end_time)
+                for _, start_time, end_time, _ in ranges
+            ]
+            self._valid_cache_key = (ranges, len(ranges), sim_time)
+        return self._valid_cache
+
+    def has_pending_included_files(self):
+        """Check if any included file is still being parsed."""
+        pending = self._parse_pending
+        return bool(pending) and any(
+            eph_config.include and eph_config.name in pending
+            for eph_config in self.config.ephemeris
+        )
+
+    def _any_included_valid(self, sim_time):
+        """Check if any included file covers sim_time."""
+        return any(
+            eph_config.include and valid
+            for eph_config, valid in zip(self.config.ephemeris, self._valid_flags(sim_time))
+        )
+
     def on_include_changed(self, index: int, state: int):
         """Handle checkbox state change for including ephemeris files."""
         if 0 <= index < len(self.config.ephemeris):
+            # The model already repainted the toggled cell; inclusion changes
+            # neither the parsed ranges nor the time fields, so no table
+            # rebuild or time write-back is needed
             self.config.ephemeris[index].include = (state == Qt.CheckState.Checked.value)
             self.update_select_all_checkbox()
             self.update_warning_visibility()
-            self.update_config()
+            self._schedule_config_changed()
 
     def on_select_all_changed(self, state: int):
         """Handle select/deselect all checkbox change."""
         checked = (state == Qt.CheckState.Checked.value)
         
-        # Block signals to prevent recursive calls
-        for i in range(len(self.config.ephemeris)):
-            self.config.ephemeris[i].include = checked
+        for eph_config in self.config.ephemeris:
+            eph_config.include = checked
         
-        # Update the table checkboxes
-        self.update_ephemeris_table()
-        self.update_warning_visibility()
-        self.update_config()
+        # Only the check boxes change; the model reads include flags live.
+        # Repaint the table once after the column and warning are updated
+        self.ephemeris_table.setUpdatesEnabled(False)
+        try:
+            self.ephemeris_model.refresh_include_column()
+            self.update_warning_visibility()
+        finally:
+            self.ephemeris_table.setUpdatesEnabled(True)
+        # Inclusion does not touch the time fields, so only announce the change
+        self._schedule_config_changed()
 
     def update_select_all_checkbox(self):
         """Update the select all checkbox based on individual checkbox states."""
@@ -735,8 +987,9 @@ class EphemerisTimeTab(QWidget):
             self.select_all_checkbox.setChecked(False)
             return
         
-        all_checked = all(eph.include for eph in self.config.ephemeris)
-        none_checked = not any(eph.include for eph in self.config.ephemeris)
+        included_count = sum(1 for eph in self.config.ephemeris if eph.include)
+        all_checked = included_count == len(self.config.ephemeris)
+        none_checked = included_count == 0
         
         # Block signals to prevent recursive calls
         self.select_all_checkbox.blockSignals(True)
@@ -760,8 +1013,7 @@ class EphemerisTimeTab(QWidget):
             return
         
         # Check if any files are selected
-        selected_files = [eph for eph in self.config.ephemeris if eph.include]
-        if not selected_files:
+        if not any(eph.include for eph in self.config.ephemeris):
             self.warning_label.setText("⚠️ Please select at least one ephemeris file")
             self._set_warning_style("error")
             self.warning_label.setVisible(True)
@@ -774,18 +1026,7 @@ class EphemerisTimeTab(QWidget):
             self.warning_label.setVisible(False)
             return
         
-        valid_selected_files = []
-        for i, eph_config in enumerate(self.config.ephemeris):
-            if not eph_config.include:
-                continue
-                
-            # Check if this file has valid time range data
-            if i < len(self.ephemeris_file_ranges):
-                file_info, start_time, end_time, constellations = self.ephemeris_file_ranges[i]
-                if start_time and end_time and start_time <= sim_time <= end_time:
-                    valid_selected_files.append(eph_config)
-        
-        if not valid_selected_files:
+        if not self._any_included_valid(sim_time) and not self.has_pending_included_files():
             self.warning_label.setText("⚠️ Please select at least one valid ephemeris file for the current simulation time")
             self._set_warning_style("warning")
             self.warning_label.setVisible(True)
@@ -794,6 +1035,11 @@ class EphemerisTimeTab(QWidget):
 
     def _set_warning_style(self, warning_type: str):
         """Set the warning label style based on warning type."""
+        # Skip re-parsing the stylesheet when the style is unchanged
+        if warning_type == self._warning_style:
+            return
+        self._warning_style = warning_type
+
         if warning_type == "critical":
             # Red for critical issues (no files loaded)
             style = """
@@ -853,7 +1099,7 @@ class EphemerisTimeTab(QWidget):
         
         self.warning_label.setStyleSheet(style)
 
-    def update_ephemeris_info(self):
+    def update_ephemeris_info(self, *args):
         """Update ephemeris information display."""
         # This could show detailed info about selected ephemeris file
         # TODO: Implement me
@@ -879,7 +1125,15 @@ class EphemerisTimeTab(QWidget):
         if selected_row < len(self.ephemeris_file_ranges):
             file_info, start_time, end_time, constellations = self.ephemeris_file_ranges[selected_row]
             
-            if start_time and end_time:
+            if file_info.name in self._parse_pending:
+                QMessageBox.warning(
+                    self,
+                    "File Not Analyzed",
+                    "The selected ephemeris file has not been analyzed yet.\n\n"
+                    "Please wait for the file analysis to complete.",
+                    QMessageBox.StandardButton.Ok
+                )
+            elif start_time and end_time:
                 # Calculate a good simulation time (start time of the ephemeris file)
                 sim_time = start_time
                 
@@ -901,26 +1155,9 @@ class EphemerisTimeTab(QWidget):
                         self.datetime_edit.setDateTime(qdt)
                     else:
                         # Convert to satellite time (simplified conversion)
-                        if time_type == TimeType.GPS:
-                            # GPS epoch: January 6, 1980
-                            gps_epoch = datetime(1980, 1, 6)
-                            delta = sim_time - gps_epoch
-                            weeks = int(delta.days / 7)
-                            seconds = (delta.days % 7) * 86400 + delta.seconds
-                            self.week_spin.setValue(weeks)
-                            self.second_spin.setValue(seconds)
-                        elif time_type == TimeType.BDS:
-                            # BDS epoch: January 1, 2006
-                            bds_epoch = datetime(2006, 1, 1)
-                            delta = sim_time - bds_epoch
-                            weeks = int(delta.days / 7)
-                            seconds = (delta.days % 7) * 86400 + delta.seconds
-                            self.week_spin.setValue(weeks)
-                            self.second_spin.setValue(seconds)
-                        elif time_type == TimeType.GALILEO:
-                            # Galileo epoch: August 22, 1999
-                            galileo_epoch = datetime(1999, 8, 22)
-                            delta = sim_time - galileo_epoch
+                        epoch = _TIME_EPOCHS.get(time_type)
+                        if epoch is not None:
+                            delta = sim_time - epoch
                             weeks = int(delta.days / 7)
                             seconds = (delta.days % 7) * 86400 + delta.seconds
                             self.week_spin.setValue(weeks)
@@ -940,7 +1177,7 @@ class EphemerisTimeTab(QWidget):
                     # Get filename for the info message
                     filename = "Unknown"
                     if selected_row < len(self.config.ephemeris):
-                        filename = os.path.basename(self.config.ephemeris[selected_row].name)
+                        filename = self.config.ephemeris[selected_row].basename
                     
                     info(f"Auto-selected start time from ephemeris file '{filename}': {sim_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
                     
@@ -964,7 +1201,7 @@ class EphemerisTimeTab(QWidget):
                 # File couldn't be parsed or no time information available
                 filename = "Unknown"
                 if selected_row < len(self.config.ephemeris):
-                    filename = os.path.basename(self.config.ephemeris[selected_row].name)
+                    filename = self.config.ephemeris[selected_row].basename
                 
                 QMessageBox.warning(
                     self,
@@ -984,6 +1221,8 @@ class EphemerisTimeTab(QWidget):
 
     def update_config(self):
         """Update configuration from widget values."""
+        if self._loading:
+            return
         # Update time configuration
         time_type = self.time_type_combo.currentData()
         self.config.time.type = time_type
@@ -1017,67 +1256,74 @@ class EphemerisTimeTab(QWidget):
             self.config.time.hour = None
             self.config.time.minute = None
 
-        self.config_changed.emit()
+        self._schedule_config_changed()
 
     def refresh_from_config(self):
         """Refresh widget values from configuration."""
-        # Block signals
-        self.type_combo.blockSignals(True)
-        self.time_type_combo.blockSignals(True)
-        self.datetime_edit.blockSignals(True)
-        self.week_spin.blockSignals(True)
-        self.second_spin.blockSignals(True)
-        self.leap_year_spin.blockSignals(True)
-        self.day_spin.blockSignals(True)
+        # Rebuild the table once for the list, analysis and time updates
+        with self._batched():
+            # Block signals
+            self.type_combo.blockSignals(True)
+            self.time_type_combo.blockSignals(True)
+            self.datetime_edit.blockSignals(True)
+            self.week_spin.blockSignals(True)
+            self.second_spin.blockSignals(True)
+            self.leap_year_spin.blockSignals(True)
+            self.day_spin.blockSignals(True)
+            self._loading = True
 
-        try:
-            # Set ephemeris type
-            if self.config.ephemeris:
-                for i in range(self.type_combo.count()):
-                    if self.type_combo.itemData(i) == self.config.ephemeris[0].type:
-                        self.type_combo.setCurrentIndex(i)
-                        break
+            try:
+                # The configuration may have been replaced or reloaded
+                self._ephemeris_name_set = {eph.name for eph in self.config.ephemeris}
 
-            # Refresh ephemeris list
-            self.refresh_ephemeris_list()
-            self.analyze_ephemeris_validity()
+                # Set ephemeris type
+                if self.config.ephemeris:
+                    for i in range(self.type_combo.count()):
+                        if self.type_combo.itemData(i) == self.config.ephemeris[0].type:
+                            self.type_combo.setCurrentIndex(i)
+                            break
+
+                # Refresh ephemeris list
+                self.refresh_ephemeris_list()
+                self.analyze_ephemeris_validity()
 
-            # Set time type
-            for i in range(self.time_type_combo.count()):
-                if self.time_type_combo.itemData(i) == self.config.time.type:
-                    self.time_type_combo.setCurrentIndex(i)
-                    break
-
-            # Set time values
-            if self.config.time.type == TimeType.UTC:
-                if all(v is not None for v in [
-                    self.config.time.year, self.config.time.month, self.config.time.day,
-                    self.config.time.hour, self.config.time.minute, self.config.time.second
-                ]):
-                    dt = QDateTime(
+                # Set time type
+                for i in range(self.time_type_combo.count()):
+                    if self.time_type_combo.itemData(i) == self.config.time.type:
+                        self.time_type_combo.setCurrentIndex(i)
+                        break
+
+                # Set time values
+                if self.config.time.type == TimeType.UTC:
+                    if all(v is not None for v in [
                         self.config.time.year, self.config.time.month, self.config.time.day,
-                        self.config.time.hour, self.config.time.minute, int(self.config.time.second)
-                    )
-                    self.datetime_edit.setDateTime(dt)
-            else:
-                if self.config.time.week is not None:
-                    self.week_spin.setValue(self.config.time.week)
-                if self.config.time.second is not None:
-                    self.second_spin.setValue(self.config.time.second)
-                if self.config.time.leap_year is not None:
-                    self.leap_year_spin.setValue(self.config.time.leap_year)
-                if self.config.time.day is not None:
-                    self.day_spin.setValue(self.config.time.day)
-
-            self.update_time_widgets()
-            self.validate_current_time()
+                        self.config.time.hour, self.config.time.minute, self.config.time.second
+                    ]):
+                        dt = QDateTime(
+                            self.config.time.year, self.config.time.month, self.config.time.day,
+                            self.config.time.hour, self.config.time.minute, int(self.config.time.second)
+                        )
+                        self.datetime_edit.setDateTime(dt)
+                else:
+                    if self.config.time.week is not None:
+                        self.week_spin.setValue(self.config.time.week)
+                    if self.config.time.second is not None:
+                        self.second_spin.setValue(self.config.time.second)
+                    if self.config.time.leap_year is not None:
+                        self.leap_year_spin.setValue(self.config.time.leap_year)
+                    if self.config.time.day is not None:
+                        self.day_spin.setValue(self.config.time.day)
 
-        finally:
-            # Re-enable signals
-            self.type_combo.blockSignals(False)
-            self.time_type_combo.blockSignals(False)
-            self.datetime_edit.blockSignals(False)
-            self.week_spin.blockSignals(False)
-            self.second_spin.blockSignals(False)
-            self.leap_year_spin.blockSignals(False)
-            self.day_spin.blockSignals(False)
\ No newline at end of file
+                self.update_time_widgets()
+                self.validate_current_time()
+
+            finally:
+                # Re-enable signals
+                self._loading = False
+                self.type_combo.blockSignals(False)
+                self.time_type_combo.blockSignals(False)
+                self.datetime_edit.blockSignals(False)
+                self.week_spin.blockSignals(False)
+                self.second_spin.blockSignals(False)
+                self.leap_year_spin.blockSignals(False)
+                self.day_spin.blockSignals(False)
\ No newline at end of file
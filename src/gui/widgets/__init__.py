@@ -7,8 +7,10 @@ This package contains custom reusable widgets for the GNSSSignalSim GUI.
 # Import all widget classes for easy access
 from .coordinate_picker import CoordinatePickerWidget
 from .embedded_map import EmbeddedMapWidget
+from .path_picker import PathPickerWidget
 
 __all__ = [
     'CoordinatePickerWidget',
     'EmbeddedMapWidget',
+    'PathPickerWidget',
 ]
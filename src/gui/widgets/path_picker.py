@@ -0,0 +1,41 @@
+"""
+Path Picker Widget
+
+A line edit paired with a browse button for selecting filesystem paths.
+"""
+
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLineEdit, QPushButton
+from PyQt6.QtCore import pyqtSignal
+
+
+class PathPickerWidget(QWidget):
+    """Line edit with a browse button in a single horizontal layout."""
+
+    pathRequested = pyqtSignal(str)  # current path text
+
+    def __init__(self, parent=None, placeholder=""):
+        super().__init__(parent)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.line_edit = QLineEdit()
+        self.line_edit.setPlaceholderText(placeholder)
+        layout.addWidget(self.line_edit)
+
+        self.browse_button = QPushButton("Browse...")
+        self.browse_button.setMaximumWidth(80)
+        self.browse_button.clicked.connect(self.on_browse_clicked)
+        layout.addWidget(self.browse_button)
+
+    def on_browse_clicked(self):
+        """Forward browse clicks with the current path."""
+        self.pathRequested.emit(self.line_edit.text())
+
+    def text(self):
+        """Return the current path text."""
+        return self.line_edit.text()
+
+    def setText(self, text):
+        """Set the current path text."""
+        self.line_edit.setText(text)
@@ -26,6 +26,7 @@ from PyQt6.QtGui import QIcon
 QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
 
 from gui.main_window import MainWindow
+from gui.styles import APP_STYLESHEET
 from core.utils.logger import info, error
 from core.utils.version import get_cached_project_info
 
@@ -45,6 +46,9 @@ def setup_application():
     app.setApplicationVersion(project_info['version'])
     app.setOrganizationName("Muhammad Qaisar Ali")
     app.setOrganizationDomain("github.com/MuhammadQaisarAli")
+
+    # Shared widget styles, parsed once for the whole application
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Set application icon if available
     icon_paths = [